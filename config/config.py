@@ -1,16 +1,31 @@
 import os
+from types import MappingProxyType
 from dotenv import load_dotenv
 
 # Load environment variables from .env file
 load_dotenv()
 
+# API credentials (임포트 시 한 번만 읽음)
+UPBIT_ACCESS_KEY = os.environ.get('UPBIT_ACCESS_KEY')
+UPBIT_SECRET_KEY = os.environ.get('UPBIT_SECRET_KEY')
+
+def _freeze(value):
+    """
+    중첩된 dict/list 설정을 읽기 전용 구조(MappingProxyType/tuple)로 변환합니다.
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
+
 # API configuration
-API_CONFIG = {
+API_CONFIG = _freeze({
     'base_url': 'https://api.upbit.com/v1',
-}
+})
 
 # Trading configuration
-TRADING_CONFIG = {
+TRADING_CONFIG = _freeze({
     'interval': 1,  # 분 단위 실행 간격
     'markets': ['KRW-BTC'],  # 거래할 마켓 목록
     'strategies': {
@@ -28,10 +43,10 @@ TRADING_CONFIG = {
             'std_dev': 2.0
         }
     }
-}
+})
 
 # Risk management configuration
-RISK_CONFIG = {
+RISK_CONFIG = _freeze({
     # 위험 관리 비활성화 - 전액 거래
     'position_size_pct': 100,  # 가능한 잔고의 100% 사용
     'max_trade_amount': 1000000000,  # 충분히 큰 값으로 설정 (10억 원)
@@ -39,7 +54,7 @@ RISK_CONFIG = {
     'max_daily_loss': 1000000000,  # 충분히 큰 값으로 설정 (10억 원)
     'stop_loss_pct': 100,  # 실질적으로 스탑로스 비활성화
     'take_profit_pct': 1000  # 실질적으로 이익실현 비활성화
-}
+})
 
 # Database configuration
 DB_CONFIG = {
@@ -59,5 +74,8 @@ DASHBOARD_CONFIG = {
     'host': '0.0.0.0',
     'port': 8050,
     'debug': False,
-    'refresh_interval': 5  # 초 단위로 대시보드 갱신 간격
+    'refresh_interval': 5,  # 초 단위로 대시보드 갱신 간격
+    'poll_interval_ms': 5000,  # 밀리초 단위 폴링 간격 (interval-component, 최소 250)
+    'slow_poll_interval_ms': 30000,  # 밀리초 단위 성능 차트 폴링 간격 (interval-slow)
+    'static_poll_interval_ms': 60000  # 밀리초 단위 전략 카드 거래 활성화 배지 폴링 간격 (interval-static)
 }
\ No newline at end of file
@@ -1,27 +1,144 @@
-import os
-import jwt
+import orjson
+import numpy as np
 import uuid
 import hashlib
+import hmac
+import base64
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import logging
-from urllib.parse import urlencode, unquote
-from config.config import API_CONFIG
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from urllib.parse import urlencode, unquote, quote_plus
+from config.config import API_CONFIG, UPBIT_ACCESS_KEY, UPBIT_SECRET_KEY
 
 logger = logging.getLogger(__name__)
 
+# 주문 상세 조회 병렬 처리 설정
+ORDER_DETAIL_WORKERS = 5
+ORDER_DETAIL_RATE = 8  # 초당 평균 최대 요청 수 (토큰 충전 속도)
+ORDER_DETAIL_BURST = ORDER_DETAIL_WORKERS  # 한 번에 허용하는 최대 요청 수
+
+# 계정 정보 캐시 유효 시간 (초)
+ACCOUNTS_CACHE_TTL = 2
+
+# 시세 조회 캐시 유효 시간 (초)
+MARKETS_CACHE_TTL = 24 * 60 * 60  # 마켓 목록은 거의 변하지 않음
+CANDLES_CACHE_TTL = 5  # 현재 봉은 계속 갱신되므로 짧게 유지
+
+# 에러 로그에 남길 응답 본문 최대 길이 (바이트)
+ERROR_BODY_LIMIT = 512
+
+# 캔들 수치 필드용 구조화 배열 타입 (KST 시각 + OHLCV)
+CANDLE_DTYPE = np.dtype([
+    ('date', 'datetime64[s]'),
+    ('open', 'f8'),
+    ('high', 'f8'),
+    ('low', 'f8'),
+    ('close', 'f8'),
+    ('volume', 'f8')
+])
+
+def candles_to_array(candles):
+    """
+    캔들 응답(dict 리스트)을 시간 오름차순 CANDLE_DTYPE 구조화 배열로 변환합니다.
+    """
+    arr = np.array([
+        (c['candle_date_time_kst'], c['opening_price'], c['high_price'],
+         c['low_price'], c['trade_price'], c['candle_acc_trade_volume'])
+        for c in candles
+    ], dtype=CANDLE_DTYPE)
+    # 업비트는 최신 캔들부터 반환하므로 오름차순으로 정렬
+    arr.sort(order='date')
+    return arr
+
+# HS256 JWT 헤더 (고정값이므로 미리 인코딩)
+_JWT_HEADER = base64.urlsafe_b64encode(orjson.dumps({'alg': 'HS256', 'typ': 'JWT'})).rstrip(b'=')
+
+def _b64url(data):
+    """
+    패딩 없는 base64url 인코딩
+    """
+    return base64.urlsafe_b64encode(data).rstrip(b'=')
+
+def _error_body(response):
+    """
+    로그용 에러 응답 본문 (최대 ERROR_BODY_LIMIT 바이트)
+    """
+    return response.content[:ERROR_BODY_LIMIT].decode('utf-8', errors='replace')
+
+def _fast_encode(params):
+    """
+    시퀀스 값이 없는 파라미터를 urlencode와 동일한 형식으로 인코딩합니다.
+    """
+    return '&'.join(f"{quote_plus(str(k), safe='')}={quote_plus(str(v), safe='')}" for k, v in params.items())
+
+def _api_call(action, default=None):
+    """
+    API 메서드 공통 예외 처리 데코레이터
+    예외 발생 시 로그를 남기고 default를 반환합니다 (호출 가능하면 호출 결과 반환).
+    """
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(self, *args, **kwargs):
+            try:
+                return func(self, *args, **kwargs)
+            except requests.exceptions.Timeout:
+                logger.error("%s 중 타임아웃 발생", action)
+            except requests.exceptions.ConnectionError:
+                logger.error("%s 중 연결 오류 발생", action)
+            except Exception as e:
+                logger.error("%s 중 오류 발생: %s", action, e)
+            return default() if callable(default) else default
+        return wrapper
+    return decorator
+
 class UpbitAPI:
     """
     Wrapper class for Upbit Exchange API
     """
     def __init__(self):
-        self.access_key = os.getenv('UPBIT_ACCESS_KEY')
-        self.secret_key = os.getenv('UPBIT_SECRET_KEY')
-        self.base_url = 'https://api.upbit.com/v1'
+        self.access_key = UPBIT_ACCESS_KEY
+        self.secret_key = UPBIT_SECRET_KEY
+        self.base_url = API_CONFIG['base_url']
         self.session = requests.Session()
+        # 커넥션 풀 설정 (keep-alive 소켓 재사용, 연결 실패만 짧은 백오프로 재시도)
+        # 읽기 오류는 재시도하지 않음: 서명된 요청을 다시 보내면 JWT nonce 가 재사용되어
+        # nonce_used 로 거절되고, 이미 처리된 주문 취소 등이 실패로 보고될 수 있음
+        retry = Retry(total=2, connect=2, read=False, backoff_factor=0.2)
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=20, max_retries=retry)
+        self.session.mount('https://', adapter)
+        # 공통 헤더는 세션에 한 번만 설정
+        self.session.headers.update({
+            'Accept': 'application/json',
+            'Content-Type': 'application/json'
+        })
         # 요청 타임아웃 설정 (초)
         self.timeout = 10
+        # 요청 속도 제한용 상태
+        self._throttle_lock = threading.Lock()
+        self._tokens = float(ORDER_DETAIL_BURST)
+        self._tokens_updated = time.monotonic()
+        # 주문 상세 조회용 워커 풀 (호출마다 스레드를 새로 만들지 않도록 재사용)
+        self._detail_executor = ThreadPoolExecutor(
+            max_workers=ORDER_DETAIL_WORKERS,
+            thread_name_prefix='upbit-order-detail'
+        )
         self.logger = logging.getLogger(__name__)
+        # 공개 시세 응답 캐시 (key -> (만료 시각, 데이터))
+        self._response_cache = {}
+        # 계정 정보 캐시 (currency -> account, 조회 시각)
+        self._accounts_index = (None, 0.0)
+        # JWT 서명용 HMAC-SHA256 (키 설정은 한 번만 하고 호출마다 copy)
+        self._jwt_hmac = hmac.new((self.secret_key or '').encode(), digestmod=hashlib.sha256)
+        # JWT 페이로드 고정 필드 (호출마다 nonce/query_hash만 추가)
+        self._payload_base = {
+            'access_key': self.access_key,
+            'query_hash_alg': 'SHA512',
+        }
         
         if not self.access_key or not self.secret_key:
             self.logger.error("API 키가 설정되지 않았습니다.")
@@ -33,164 +150,195 @@ class UpbitAPI:
         """
         Create JWT authentication token
         """
-        payload = {
-            'access_key': self.access_key,
-            'nonce': str(uuid.uuid4()),
-            'query_hash': self._hash_query(params) if params else None,
-            'query_hash_alg': 'SHA512',
-        }
+        payload = dict(
+            self._payload_base,
+            nonce=str(uuid.uuid4()),
+            query_hash=self._hash_query(params) if params else None
+        )
         
-        jwt_token = jwt.encode(payload, self.secret_key)
-        return jwt_token
+        signing_input = _JWT_HEADER + b'.' + _b64url(orjson.dumps(payload))
+        mac = self._jwt_hmac.copy()
+        mac.update(signing_input)
+        return (signing_input + b'.' + _b64url(mac.digest())).decode()
     
     def _hash_query(self, params):
-        query_string = urlencode(params, doseq=True)
-        m = hashlib.sha512()
-        m.update(query_string.encode())
-        return m.hexdigest()
+        if any(isinstance(v, (list, tuple)) for v in params.values()):
+            query_string = urlencode(params, doseq=True)
+        else:
+            query_string = _fast_encode(params)
+        return hashlib.sha512(query_string.encode()).hexdigest()
     
     def _request(self, method, endpoint, params=None, data=None):
         """
         Make a request to the Upbit API
         """
-        headers = {
-            'Accept': 'application/json',
-            'Content-Type': 'application/json'
-        }
-        
         url = f"{self.base_url}{endpoint}"
         
         if method != 'POST':
-            headers['Authorization'] = f"Bearer {self._get_token(params)}"
+            headers = {'Authorization': f"Bearer {self._get_token(params)}"}
         else:
-            headers['Authorization'] = f"Bearer {self._get_token()}"
+            headers = {'Authorization': f"Bearer {self._get_token(data)}"}
         
+        response = None
         try:
-            response = requests.request(method, url, params=params, json=data, headers=headers)
+            response = self.session.request(method, url, params=params, json=data, headers=headers, timeout=self.timeout)
             response.raise_for_status()
-            return response.json()
+            return orjson.loads(response.content)
         except requests.exceptions.RequestException as e:
-            logger.error(f"API request error: {e}")
-            if response.text:
-                logger.error(f"Response: {response.text}")
+            logger.error("API request error: %s", e)
+            if response is not None and response.content:
+                logger.error("Response: %s", _error_body(response))
             raise
     
+    def _parse_response(self, response, action, expected_status=200):
+        """
+        응답 상태를 확인하고 JSON을 디코딩합니다 (실패 시 로그 후 None 반환)
+        """
+        if response.status_code != expected_status:
+            logger.error("%s 실패: %s", action, response.status_code)
+            logger.error("에러 메시지: %s", _error_body(response))
+            return None
+        return orjson.loads(response.content)
+    
     # Account endpoints
+    @_api_call('계정 정보 조회')
     def get_accounts(self):
         """
         계정 정보 조회
+        짧은 시간 내 반복 호출은 캐시에서 반환하여 JWT 생성과 요청을 생략합니다.
+        (업비트는 nonce 재사용을 거부하므로 토큰 자체는 캐시하지 않음)
         """
-        try:
-            jwt_token = self._get_token({})
-            headers = {"Authorization": f"Bearer {jwt_token}"}
-            
-            response = self.session.get(f"{self.base_url}/accounts", headers=headers)
-            response.raise_for_status()
-            accounts = response.json()
-            
-            self.logger.debug(f"계정 정보: {accounts}")
-            return accounts
-        except Exception as e:
-            self.logger.error(f"계정 정보 조회 중 오류 발생: {str(e)}")
+        index, fetched_at = self._accounts_index
+        if index is not None and time.monotonic() - fetched_at < ACCOUNTS_CACHE_TTL:
+            return list(index.values())
+        
+        headers = {"Authorization": f"Bearer {self._get_token({})}"}
+        response = self.session.get(f"{self.base_url}/accounts", headers=headers)
+        accounts = self._parse_response(response, '계정 정보 조회')
+        if accounts is None:
             return None
+        
+        self._accounts_index = ({account['currency']: account for account in accounts}, time.monotonic())
+        self.logger.debug("계정 정보: %s", accounts)
+        return accounts
+    
+    def _get_accounts_indexed(self):
+        """
+        화폐 코드로 색인된 계정 정보를 반환합니다 (짧은 TTL 캐시)
+        """
+        if self.get_accounts() is None:
+            return {}
+        return self._accounts_index[0] or {}
+    
+    def _invalidate_accounts(self):
+        """
+        계정 캐시를 무효화합니다 (주문/취소 후 잔고 변경 반영)
+        """
+        self._accounts_index = (None, 0.0)
     
     def get_account(self, currency):
         """
         Get specific currency account
         """
-        accounts = self.get_accounts()
-        for account in accounts:
-            if account['currency'] == currency:
-                return account
-        return None
+        return self._get_accounts_indexed().get(currency)
     
     def get_balance(self, currency):
         """
         Get balance for specific currency
         """
-        account = self.get_account(currency)
+        account = self._get_accounts_indexed().get(currency)
         if account:
             return float(account['balance'])
         return 0.0
     
+    @_api_call('계정 정보 새로고침')
     def refresh_accounts(self):
         """
         계정 정보를 새로 가져와서 캐시를 갱신합니다.
         주로 대시보드와 실제 계정 정보의 동기화를 위해 사용됩니다.
         """
-        try:
-            # JWT 토큰 생성 및 계정 정보 요청
-            jwt_token = self._get_token({})
-            headers = {"Authorization": f"Bearer {jwt_token}"}
-            
-            # 캐시 만료를 방지하기 위해 no-cache 헤더 추가
-            headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
-            headers["Pragma"] = "no-cache"
-            
-            response = self.session.get(f"{self.base_url}/accounts", headers=headers)
-            
-            if response.status_code != 200:
-                logger.error(f"계정 정보 새로고침 실패: {response.status_code}")
-                logger.error(f"에러 메시지: {response.text}")
-                return None
-                
-            accounts = response.json()
-            logger.info(f"계정 정보가 성공적으로 새로고침되었습니다: {len(accounts)}개 계정")
-            return accounts
-            
-        except Exception as e:
-            logger.error(f"계정 정보 새로고침 중 에러 발생: {str(e)}")
+        # JWT 토큰 생성 및 계정 정보 요청
+        headers = {"Authorization": f"Bearer {self._get_token({})}"}
+        
+        # 캐시 만료를 방지하기 위해 no-cache 헤더 추가
+        headers["Cache-Control"] = "no-cache, no-store, must-revalidate"
+        headers["Pragma"] = "no-cache"
+        
+        response = self.session.get(f"{self.base_url}/accounts", headers=headers)
+        accounts = self._parse_response(response, '계정 정보 새로고침')
+        if accounts is None:
             return None
+        
+        self._accounts_index = ({account['currency']: account for account in accounts}, time.monotonic())
+        logger.info("계정 정보가 성공적으로 새로고침되었습니다: %d개 계정", len(accounts))
+        return accounts
+    
+    def _cache_get(self, key):
+        """
+        만료되지 않은 캐시 응답을 반환합니다 (없으면 None)
+        """
+        entry = self._response_cache.get(key)
+        if entry and time.monotonic() < entry[0]:
+            return entry[1]
+        return None
+    
+    def _cache_set(self, key, data, ttl):
+        """
+        응답을 주어진 TTL(초) 동안 캐시합니다.
+        """
+        self._response_cache[key] = (time.monotonic() + ttl, data)
     
     # Market endpoints
     def get_markets(self):
         """
         Get available markets
         """
-        return self._request('GET', '/market/all')
+        cache_key = ('markets',)
+        markets = self._cache_get(cache_key)
+        if markets is None:
+            markets = self._request('GET', '/market/all')
+            self._cache_set(cache_key, markets, MARKETS_CACHE_TTL)
+        return markets
     
+    @_api_call('티커 정보 조회')
     def get_ticker(self, market):
         """
         Get current ticker information for a market
+        :param market: 마켓 ID 또는 마켓 ID 리스트 (리스트인 경우 한 번의 요청으로 조회)
         """
-        try:
-            params = {'markets': market}
-            url = f"{self.base_url}/ticker"
-            headers = {"Authorization": f"Bearer {self._get_token(params)}"}
-            
-            response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
-            
-            if response.status_code != 200:
-                logger.error(f"티커 정보 조회 실패: {response.status_code}")
-                logger.error(f"에러 메시지: {response.text}")
-                return None
-                
-            return response.json()
-            
-        except requests.exceptions.Timeout:
-            logger.error(f"티커 정보 조회 중 타임아웃 발생: {market}")
-            return None
-        except requests.exceptions.ConnectionError:
-            logger.error(f"티커 정보 조회 중 연결 오류 발생: {market}")
-            return None
-        except Exception as e:
-            logger.error(f"티커 정보 조회 중 오류 발생: {str(e)}")
-            return None
+        if isinstance(market, list):
+            market = ','.join(market)
+        params = {'markets': market}
+        url = f"{self.base_url}/ticker"
+        headers = {"Authorization": f"Bearer {self._get_token(params)}"}
+        
+        response = self.session.get(url, params=params, headers=headers, timeout=self.timeout)
+        return self._parse_response(response, '티커 정보 조회')
+    
+    def get_tickers(self, markets):
+        """
+        여러 마켓의 티커 정보를 한 번의 요청으로 조회합니다.
+        :param markets: 마켓 ID 리스트 (예: ['KRW-BTC', 'KRW-ETH'])
+        :return: 마켓 ID를 키로 하는 티커 딕셔너리
+        """
+        if not markets:
+            return {}
+        tickers = self.get_ticker(list(markets))
+        if not tickers:
+            return {}
+        return {ticker['market']: ticker for ticker in tickers}
     
+    @_api_call('현재가 조회')
     def get_current_price(self, market):
         """
         현재 시장 가격을 조회합니다.
         :param market: 마켓 ID (예: KRW-BTC)
         :return: 현재 가격 (숫자) 또는 조회 실패 시 None
         """
-        try:
-            ticker = self.get_ticker(market)
-            if ticker and len(ticker) > 0:
-                return float(ticker[0]['trade_price'])
-            return None
-        except Exception as e:
-            logger.error(f"{market} 현재가 조회 중 오류 발생: {str(e)}")
-            return None
+        ticker = self.get_ticker(market)
+        if ticker and len(ticker) > 0:
+            return float(ticker[0]['trade_price'])
+        return None
     
     def get_orderbook(self, markets):
         """
@@ -201,154 +349,176 @@ class UpbitAPI:
         params = {'markets': markets}
         return self._request('GET', '/orderbook', params=params)
     
+    @_api_call('캔들 데이터 조회')
     def get_candles(self, market, interval='minutes', count=100, unit=1):
         """
         Get candle data for a market
         """
-        try:
-            if market != 'KRW-BTC':
-                return None
-                
-            url = f"{self.base_url}/candles/{interval}/{unit}"
-            params = {
-                'market': market,
-                'count': count
-            }
-            response = self.session.get(url, params=params)
-            
-            if response.status_code != 200:
-                logger.error(f"캔들 데이터 조회 실패: {response.status_code}")
-                logger.error(f"에러 메시지: {response.text}")
-                return None
-                
-            return response.json()
-            
-        except Exception as e:
-            logger.error(f"캔들 데이터 조회 중 에러 발생: {str(e)}")
+        cache_key = ('candles', market, interval, unit, count)
+        candles = self._cache_get(cache_key)
+        if candles is not None:
+            return candles
+        
+        url = f"{self.base_url}/candles/{interval}/{unit}"
+        params = {
+            'market': market,
+            'count': count
+        }
+        response = self.session.get(url, params=params)
+        candles = self._parse_response(response, '캔들 데이터 조회')
+        if candles is not None:
+            self._cache_set(cache_key, candles, CANDLES_CACHE_TTL)
+        return candles
+    
+    def get_candles_array(self, market, interval='minutes', count=100, unit=1):
+        """
+        캔들 데이터를 시간 오름차순 NumPy 구조화 배열(CANDLE_DTYPE)로 반환합니다.
+        """
+        candles = self.get_candles(market, interval, count, unit)
+        if not candles:
             return None
+        return candles_to_array(candles)
     
     # Order endpoints
+    @_api_call('주문 실행')
     def place_order(self, market, side, volume, price=None, ord_type='limit'):
         """
         Place a new order
         """
-        try:
-            url = f"{self.base_url}/orders"
-            data = {
-                'market': market,
-                'side': side,
-                'ord_type': ord_type
-            }
+        url = f"{self.base_url}/orders"
+        data = {
+            'market': market,
+            'side': side,
+            'ord_type': ord_type
+        }
 
-            if ord_type == 'limit':
-                data['volume'] = str(volume)
+        if ord_type == 'limit':
+            data['volume'] = str(volume)
+            data['price'] = str(price)
+        elif ord_type == 'market':
+            if side == 'bid':
                 data['price'] = str(price)
-            elif ord_type == 'market':
-                if side == 'bid':
-                    data['price'] = str(price)
-                else:
-                    data['volume'] = str(volume)
+            else:
+                data['volume'] = str(volume)
 
-            headers = {"Authorization": f"Bearer {self._get_token(data)}"}
-            response = self.session.post(url, json=data, headers=headers)
-            
-            if response.status_code == 400:
-                error_msg = response.json().get('error', {}).get('message', '알 수 없는 에러')
-                logger.warning(f"주문 실패: {error_msg}")
-                return None
-                
-            if response.status_code != 201:
-                logger.error(f"주문 실행 실패: {response.status_code}")
-                logger.error(f"에러 메시지: {response.text}")
-                return None
-                
-            return response.json()
-            
-        except Exception as e:
-            logger.error(f"주문 실행 중 에러 발생: {str(e)}")
+        headers = {"Authorization": f"Bearer {self._get_token(data)}"}
+        response = self.session.post(url, json=data, headers=headers)
+        # 주문/취소 요청 후에는 잔고가 바뀌므로 계정 캐시 무효화
+        self._invalidate_accounts()
+        
+        if response.status_code == 400:
+            error_msg = orjson.loads(response.content).get('error', {}).get('message', '알 수 없는 에러')
+            logger.warning("주문 실패: %s", error_msg)
             return None
+        
+        return self._parse_response(response, '주문 실행', expected_status=201)
     
+    @_api_call('주문 조회')
     def get_order(self, uuid):
         """
         Get order information
         """
-        try:
-            url = f"{self.base_url}/order"
-            params = {'uuid': uuid}
-            headers = {"Authorization": f"Bearer {self._get_token(params)}"}
-            
-            response = self.session.get(url, params=params, headers=headers)
-            
-            if response.status_code == 404:
-                logger.warning(f"주문을 찾을 수 없음: {uuid}")
-                return None
-                
-            if response.status_code != 200:
-                logger.error(f"주문 조회 실패: {response.status_code}")
-                logger.error(f"에러 메시지: {response.text}")
-                return None
-                
-            return response.json()
-            
-        except Exception as e:
-            logger.error(f"주문 조회 중 에러 발생: {str(e)}")
+        url = f"{self.base_url}/order"
+        params = {'uuid': uuid}
+        headers = {"Authorization": f"Bearer {self._get_token(params)}"}
+        
+        response = self.session.get(url, params=params, headers=headers)
+        
+        if response.status_code == 404:
+            logger.warning("주문을 찾을 수 없음: %s", uuid)
             return None
+        
+        return self._parse_response(response, '주문 조회')
     
+    @_api_call('주문 취소')
     def cancel_order(self, uuid):
         """
         Cancel an existing order
         """
-        try:
-            url = f"{self.base_url}/order"
-            data = {'uuid': uuid}
-            headers = {"Authorization": f"Bearer {self._get_token(data)}"}
-            
-            response = self.session.delete(url, json=data, headers=headers)
-            
-            if response.status_code == 404:
-                logger.warning(f"취소할 주문을 찾을 수 없음: {uuid}")
-                return None
-                
-            if response.status_code != 200:
-                logger.error(f"주문 취소 실패: {response.status_code}")
-                logger.error(f"에러 메시지: {response.text}")
-                return None
-                
-            return response.json()
-            
-        except Exception as e:
-            logger.error(f"주문 취소 중 에러 발생: {str(e)}")
+        url = f"{self.base_url}/order"
+        data = {'uuid': uuid}
+        headers = {"Authorization": f"Bearer {self._get_token(data)}"}
+        
+        response = self.session.delete(url, json=data, headers=headers)
+        # 주문/취소 요청 후에는 잔고가 바뀌므로 계정 캐시 무효화
+        self._invalidate_accounts()
+        
+        if response.status_code == 404:
+            logger.warning("취소할 주문을 찾을 수 없음: %s", uuid)
             return None
+        
+        return self._parse_response(response, '주문 취소')
     
+    @_api_call('주문 목록 조회')
     def get_orders(self, market, state='wait', page=1, limit=100):
         """
         Get list of orders
         state: wait, done, cancel
         """
-        try:
-            params = {
-                'market': market,
-                'state': state,
-                'page': page,
-                'limit': limit
-            }
-            
-            url = f"{self.base_url}/orders"
-            headers = {"Authorization": f"Bearer {self._get_token(params)}"}
-            
-            response = self.session.get(url, params=params, headers=headers)
+        params = {
+            'market': market,
+            'state': state,
+            'page': page,
+            'limit': limit
+        }
+        
+        url = f"{self.base_url}/orders"
+        headers = {"Authorization": f"Bearer {self._get_token(params)}"}
+        
+        response = self.session.get(url, params=params, headers=headers)
+        return self._parse_response(response, '주문 목록 조회')
+
+    def _throttle(self):
+        """
+        토큰 버킷 방식으로 요청 속도를 제한합니다 (여러 스레드에서 공유)
+        실제 경과 시간만큼 토큰을 충전하므로 이미 충분히 지난 경우에는 대기하지 않습니다.
+        """
+        with self._throttle_lock:
+            now = time.monotonic()
+            elapsed = now - self._tokens_updated
+            self._tokens = min(ORDER_DETAIL_BURST, self._tokens + elapsed * ORDER_DETAIL_RATE)
+            self._tokens_updated = now
+            # 토큰이 음수가 되면 그만큼 다음 충전을 예약하고 대기
+            self._tokens -= 1
+            wait = -self._tokens / ORDER_DETAIL_RATE if self._tokens < 0 else 0
+        if wait > 0:
+            time.sleep(wait)
+
+    def _fetch_order_detail(self, order):
+        """
+        체결된 주문의 상세 정보를 조회하여 주문 객체에 체결가격/수량을 설정합니다.
+        """
+        # 기본값 설정 (API 실패 시에도 작동하도록)
+        order['trades_price'] = float(order.get('price', 0))
+        order['executed_volume'] = float(order.get('volume', 0))
+        
+        # 체결된 주문의 상세 정보 조회를 위한 새로운 JWT 토큰 생성
+        order_query = {'uuid': order['uuid']}
+        order_headers = {'Authorization': f'Bearer {self._get_token(order_query)}'}
+        
+        # 주문 상세 정보 요청
+        self._throttle()
+        trades_response = self.session.get(
+            f"{self.base_url}/order",
+            params=order_query,
+            headers=order_headers,
+            timeout=self.timeout
+        )
+        
+        if trades_response.status_code == 200:
+            trade_info = orjson.loads(trades_response.content)
             
-            if response.status_code != 200:
-                logger.error(f"주문 목록 조회 실패: {response.status_code}")
-                logger.error(f"에러 메시지: {response.text}")
-                return None
-                
-            return response.json()
+            # 체결 정보 설정
+            order['trades_price'] = float(trade_info.get('trades_avg_price', trade_info.get('price', order['trades_price'])))
+            order['executed_volume'] = float(trade_info.get('executed_volume', trade_info.get('volume', order['executed_volume'])))
             
-        except Exception as e:
-            logger.error(f"주문 목록 조회 중 에러 발생: {str(e)}")
-            return None
+            logger.debug("주문 상세 정보: %s", trade_info)
+        else:
+            logger.warning("주문 상세 정보 조회 실패: %s, %s", trades_response.status_code, _error_body(trades_response))
+        
+        return order
 
+    @_api_call('주문 내역 조회', default=list)
     def get_order_history(self, market=None, state='done', count=20):
         """
         주문 내역을 조회합니다.
@@ -357,114 +527,56 @@ class UpbitAPI:
         :param count: 조회할 주문 개수
         :return: 주문 내역 리스트
         """
-        try:
-            # 주문 내역 조회
-            query = {}
-            if state:
-                query['state'] = state
-            if market:
-                query['market'] = market
-            if count:
-                query['limit'] = count
+        # 주문 내역 조회
+        query = {}
+        if state:
+            query['state'] = state
+        if market:
+            query['market'] = market
+        if count:
+            query['limit'] = count
 
-            # JWT 토큰 생성
-            payload = {
-                'access_key': self.access_key,
-                'nonce': str(uuid.uuid4()),
-            }
-            
-            if query:
-                query_string = urlencode(query)
-                m = hashlib.sha512()
-                m.update(query_string.encode())
-                payload['query_hash'] = m.hexdigest()
-                payload['query_hash_alg'] = 'SHA512'
-            
-            jwt_token = jwt.encode(payload, self.secret_key)
-            headers = {'Authorization': f'Bearer {jwt_token}'}
-            
-            # 주문 내역 조회 요청
-            response = self.session.get(
-                f"{self.base_url}/orders", 
-                params=query, 
-                headers=headers
-            )
-            response.raise_for_status()
-            
-            orders = response.json()
-            logger.debug(f"주문 내역 조회 응답: {orders}")
-            
-            # 더미 데이터 추가 (테스트용)
-            if not orders:
-                logger.warning("주문 내역이 없어 더미 데이터로 대체합니다.")
-                return []
-            
-            # 각 주문에 대해 체결 내역 조회 (지연 추가)
-            for order in orders:
+        # JWT 토큰 생성
+        headers = {'Authorization': f'Bearer {self._get_token(query)}'}
+        
+        # 주문 내역 조회 요청
+        response = self.session.get(
+            f"{self.base_url}/orders", 
+            params=query, 
+            headers=headers
+        )
+        response.raise_for_status()
+        
+        orders = orjson.loads(response.content)
+        logger.debug("주문 내역 조회 응답: %s", orders)
+        
+        # 더미 데이터 추가 (테스트용)
+        if not orders:
+            logger.warning("주문 내역이 없어 더미 데이터로 대체합니다.")
+            return []
+        
+        # 체결된 주문의 상세 정보를 병렬로 조회 (주문 객체에 직접 반영됨)
+        done_orders = [order for order in orders if order.get('state') == 'done']
+        if done_orders:
+            futures = [self._detail_executor.submit(self._fetch_order_detail, order) for order in done_orders]
+            for future in as_completed(futures):
                 try:
-                    if order['state'] == 'done':
-                        # 기본값 설정 (API 실패 시에도 작동하도록)
-                        order['trades_price'] = float(order.get('price', 0))
-                        order['executed_volume'] = float(order.get('volume', 0))
-                        
-                        # 체결된 주문의 상세 정보 조회를 위한 새로운 JWT 토큰 생성
-                        order_query = {'uuid': order['uuid']}
-                        order_payload = {
-                            'access_key': self.access_key,
-                            'nonce': str(uuid.uuid4()),
-                            'query_hash': self._hash_query(order_query),
-                            'query_hash_alg': 'SHA512'
-                        }
-                        
-                        order_jwt_token = jwt.encode(order_payload, self.secret_key)
-                        order_headers = {'Authorization': f'Bearer {order_jwt_token}'}
-                        
-                        # 주문 상세 정보 요청
-                        trades_response = self.session.get(
-                            f"{self.base_url}/order",
-                            params=order_query,
-                            headers=order_headers
-                        )
-                        
-                        if trades_response.status_code == 200:
-                            trade_info = trades_response.json()
-                            
-                            # 체결 정보 설정
-                            order['trades_price'] = float(trade_info.get('trades_avg_price', trade_info.get('price', order['trades_price'])))
-                            order['executed_volume'] = float(trade_info.get('executed_volume', trade_info.get('volume', order['executed_volume'])))
-                            
-                            logger.debug(f"주문 상세 정보: {trade_info}")
-                        else:
-                            logger.warning(f"주문 상세 정보 조회 실패: {trades_response.status_code}, {trades_response.text}")
-                        
-                        # 요청 간에 약간의 지연 추가 (0.2초)
-                        time.sleep(0.2)
+                    future.result()
                 except Exception as e:
-                    logger.error(f"주문 상세 정보 조회 중 오류 발생: {str(e)}")
-                    # 오류가 발생해도 계속 진행
-                    continue
-            
-            return orders
-
-        except Exception as e:
-            logger.error(f"주문 내역 조회 중 오류 발생: {str(e)}")
-            return []
+                    logger.error("주문 상세 정보 조회 중 오류 발생: %s", e)
+        
+        return orders
 
+    @_api_call('평균 매수가 조회')
     def get_avg_buy_price(self, currency):
         """
         특정 화폐의 평균 매수가격을 조회합니다.
         :param currency: 화폐 코드 (예: BTC)
         :return: 평균 매수가격 (숫자) 또는 조회 실패 시 None
         """
-        try:
-            accounts = self.get_accounts()
-            for account in accounts:
-                if account['currency'] == currency:
-                    if 'avg_buy_price' in account:
-                        return float(account['avg_buy_price'])
-            
-            logger.warning(f"{currency}의 평균 매수가를 찾을 수 없습니다.")
-            return None
-        except Exception as e:
-            logger.error(f"{currency} 평균 매수가 조회 중 오류 발생: {str(e)}")
-            return None
\ No newline at end of file
+        account = self._get_accounts_indexed().get(currency)
+        if account and 'avg_buy_price' in account:
+            return float(account['avg_buy_price'])
+        
+        logger.warning("%s의 평균 매수가를 찾을 수 없습니다.", currency)
+        return None
\ No newline at end of file
@@ -1,28 +1,103 @@
 import logging
 import dash
-from dash import dcc, html
-from dash.dependencies import Input, Output, State
+from dash import dcc, html, dash_table, Patch
+from dash.dependencies import Input, Output, State, ClientsideFunction
+from dash.exceptions import PreventUpdate
 import plotly.graph_objs as go
+import plotly.io as pio
 import pandas as pd
+import functools
+import hashlib
+import importlib.util
 import threading
 import time
-from datetime import datetime, timedelta, timezone
+from datetime import datetime, timedelta
 import dash_bootstrap_components as dbc
 import numpy as np
-import traceback
 import requests.exceptions
+import flask
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 
 from config.config import DASHBOARD_CONFIG, TRADING_CONFIG
-from src.api.upbit_api import UpbitAPI
+from src.api.upbit_api import UpbitAPI, candles_to_array
 
 logger = logging.getLogger(__name__)
 
+# Dash 콜백 응답(figure 포함) 직렬화를 orjson 으로 고정 ('auto' 일 때 미설치 시 조용히 json 으로 떨어짐)
+pio.json.config.default_engine = 'orjson'
+
 # 전역 변수로 트레이딩 엔진 선언 (main.py에서 설정됨)
 TRADING_ENGINE = None
 
 # Initialize API client
 api = UpbitAPI()
 
+# 대시보드 시세 캐시 유효 시간 (초) - 갱신 주기 동안 모든 접속자가 같은 응답을 공유
+TICKER_CACHE_TTL = DASHBOARD_CONFIG.get('refresh_interval', 5)
+
+# interval-component 폴링 간격 (밀리초) - 너무 짧으면 콜백/요청이 과도해지므로 하한을 둠
+MIN_POLL_INTERVAL_MS = 250
+POLL_INTERVAL_MS = max(MIN_POLL_INTERVAL_MS, int(DASHBOARD_CONFIG.get('poll_interval_ms', 2000)))
+
+# interval-slow / interval-static 폴링 간격 (밀리초) - 천천히 바뀌는 성능 차트와 거래 활성화 배지용
+# 각각 앞 단계 주기보다 짧게 두지 않음
+SLOW_POLL_INTERVAL_MS = max(POLL_INTERVAL_MS, int(DASHBOARD_CONFIG.get('slow_poll_interval_ms', 30000)))
+STATIC_POLL_INTERVAL_MS = max(SLOW_POLL_INTERVAL_MS, int(DASHBOARD_CONFIG.get('static_poll_interval_ms', 60000)))
+
+# 트레이딩 상태 표시 문자열
+STATUS_NO_ENGINE = "트레이딩 상태: 엔진 미초기화"
+STATUS_RUNNING = "트레이딩 상태: 실행 중"
+STATUS_RUNNING_DISABLED = "트레이딩 상태: 엔진 실행 중 (거래 비활성화)"
+STATUS_STOPPED = "트레이딩 상태: 중지됨"
+
+def ttl_memoize(ttl):
+    """
+    인자별로 결과를 ttl 초 동안 재사용하는 데코레이터 (실패/빈 응답은 캐시하지 않음)
+    """
+    def decorator(func):
+        cache = {}
+        
+        @functools.wraps(func)
+        def wrapper(*args):
+            now = time.monotonic()
+            entry = cache.get(args)
+            if entry and now < entry[0]:
+                return entry[1]
+            result = func(*args)
+            if result:
+                cache[args] = (now + ttl, result)
+            return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    return decorator
+
+# 주기적 Upbit 조회를 병렬로 실행하는 스레드 풀
+SNAPSHOT_WORKERS = 4
+snapshot_executor = ThreadPoolExecutor(max_workers=SNAPSHOT_WORKERS, thread_name_prefix='dashboard-snapshot')
+
+@ttl_memoize(TICKER_CACHE_TTL)
+def cached_ticker(market):
+    """
+    티커 조회 결과를 짧게 캐시합니다. (계좌/캔들은 UpbitAPI 내부 캐시 사용)
+    """
+    return api.get_ticker(market)
+
+@ttl_memoize(TICKER_CACHE_TTL)
+def cached_tickers(markets):
+    """
+    여러 마켓의 티커를 한 번의 요청으로 조회해 짧게 캐시합니다. (markets: 정렬된 tuple)
+    """
+    return api.get_tickers(list(markets))
+
+@ttl_memoize(TICKER_CACHE_TTL)
+def cached_order_history(market, state, count):
+    """
+    주문 내역 조회 결과를 짧게 캐시합니다. (여러 접속자의 갱신 주기가 겹쳐도 한 번만 조회)
+    """
+    return api.get_order_history(market=market, state=state, count=count)
+
 # 테마 정의
 THEMES = {
     'DARK': dbc.themes.DARKLY,
@@ -32,29 +107,102 @@ THEMES = {
 # 현재 테마 상태 (초기값: 다크모드)
 current_theme = 'DARK'
 
+# 콜백 응답(차트 배열/컴포넌트 JSON) 압축 전송 - Dash 의 compress 옵션은 flask-compress 가 필요
+COMPRESS_RESPONSES = importlib.util.find_spec('flask_compress') is not None
+if not COMPRESS_RESPONSES:
+    logger.warning("flask-compress 가 설치되어 있지 않아 응답을 압축하지 않습니다.")
+
 # Initialize app with the current theme
 app = dash.Dash(
     __name__, 
     external_stylesheets=[THEMES[current_theme]],
     suppress_callback_exceptions=True,
+    # 콜백마다 문서 제목을 "Updating..."으로 바꾸지 않음
+    update_title=None,
+    compress=COMPRESS_RESPONSES,
     meta_tags=[
         {"name": "viewport", "content": "width=device-width, initial-scale=1"}
     ]
 )
 server = app.server
+
+class OrjsonJSONProvider(flask.json.provider.DefaultJSONProvider):
+    """
+    Flask JSON 응답(jsonify 등)을 orjson 으로 직렬화하는 JSON 프로바이더
+    """
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(
+            obj,
+            default=self.default,
+            option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        ).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+# 콜백 응답은 plotly.io 의 orjson 엔진을, 그 외 Flask JSON 응답은 이 프로바이더를 사용
+server.json = OrjsonJSONProvider(server)
 app.title = "업비트 트레이딩 대시보드"
 
+# 성능 기록 최대 보관 개수 (초과 시 가장 오래된 기록부터 덮어씀)
+PERF_HISTORY_SIZE = 1440
+
+class PerfRing:
+    """
+    날짜/일간 손익/누적 손익을 고정 크기 NumPy 배열에 보관하는 링 버퍼
+    """
+    __slots__ = ('dates', 'pnl', 'cum', 'i', 'n', 'full')
+    
+    def __init__(self, n=PERF_HISTORY_SIZE):
+        self.dates = np.empty(n, dtype='datetime64[s]')
+        self.pnl = np.zeros(n, dtype='f8')
+        self.cum = np.zeros(n, dtype='f8')
+        self.i = 0
+        self.n = n
+        self.full = False
+    
+    def __len__(self):
+        return self.n if self.full else self.i
+    
+    def extend(self, dates, pnl):
+        """
+        새 기록을 뒤에 추가합니다. (누적 손익은 마지막 값에 이어서 계산)
+        """
+        pnl = np.asarray(pnl, dtype='f8')
+        last_cum = self.cum[self.i - 1] if len(self) else 0.0
+        cum = (last_cum + np.cumsum(pnl))[-self.n:]
+        dates = np.asarray(dates, dtype='datetime64[s]')[-self.n:]
+        pnl = pnl[-self.n:]
+        idx = (self.i + np.arange(len(pnl))) % self.n
+        self.dates[idx] = dates
+        self.pnl[idx] = pnl
+        self.cum[idx] = cum
+        self.full = self.full or self.i + len(pnl) >= self.n
+        self.i = (self.i + len(pnl)) % self.n
+    
+    def append(self, date, pnl):
+        self.extend([date], [pnl])
+    
+    def view(self):
+        """
+        시간순으로 정렬된 (dates, pnl, cum) 배열을 반환합니다.
+        """
+        if not self.full:
+            return self.dates[:self.i], self.pnl[:self.i], self.cum[:self.i]
+        order = np.r_[self.i:self.n, 0:self.i]
+        return self.dates[order], self.pnl[order], self.cum[order]
+
 # Cache for data
 data_cache = {
     'balances': {},
     'trades': [],
     'market_data': {},
-    'performance': {
-        'dates': [],
-        'pnl': []
-    }
+    'performance': PerfRing()
 }
 
+# 거래 시간 표시 기준 시간대
+KST = 'Asia/Seoul'
+
 # Markets to display
 markets = TRADING_CONFIG.get('markets', ['KRW-BTC'])
 
@@ -96,9 +244,135 @@ COLORS = {
     }
 }
 
-# 현재 테마에 따른 스타일 가져오기
-def get_current_styles():
-    theme_key = 'dark' if current_theme == 'DARK' else 'light'
+def _build_chart_template(base, colors):
+    """
+    기본 Plotly 템플릿에 대시보드 공통 차트 스타일을 덧씌운 템플릿을 생성합니다.
+    """
+    template = go.layout.Template(pio.templates[base])
+    template.layout.update(
+        paper_bgcolor=colors['card_bg'],
+        plot_bgcolor=colors['card_bg'],
+        font=dict(color=colors['text']),
+        xaxis=dict(showgrid=True, gridcolor=colors['grid'], zeroline=False),
+        yaxis=dict(showgrid=True, gridcolor=colors['grid'], zeroline=False),
+        margin=dict(l=50, r=50, t=50, b=50, pad=4),
+        legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+    )
+    return template
+
+# 차트 템플릿은 임포트 시 한 번만 등록
+pio.templates['upbit_dark'] = _build_chart_template('plotly_dark', COLORS['dark'])
+pio.templates['upbit_light'] = _build_chart_template('plotly_white', COLORS['light'])
+
+# 성능 차트 고정 속성 (assets/performance.js 가 performance-data 로 차트를 조립할 때 사용)
+# 테마별 배경/글꼴/격자/여백/범례는 theme-palette 의 템플릿을 적용
+PERFORMANCE_STYLE = {
+    'layout': dict(
+        title='누적 손익 추이',
+        xaxis=dict(title='날짜'),
+        yaxis=dict(
+            title='누적 손익 (KRW)',
+            side='left'
+        ),
+        yaxis2=dict(
+            title='일간 손익 (KRW)',
+            overlaying='y',
+            side='right',
+            showgrid=False
+        ),
+        height=350,
+        hovermode='x unified'
+    ),
+    # 일간 손익 막대 / 현재 누적 손익 주석
+    'bar': dict(name='일간 손익', opacity=0.7, yaxis='y2'),
+    'annotation': dict(showarrow=True, arrowhead=2, arrowsize=1, arrowwidth=2, borderwidth=2, borderpad=4),
+    # 누적 손익 영역 채우기 투명도
+    'fill_alpha': 0.2
+}
+
+# 가격 차트 고정 레이아웃 (제목/템플릿만 update_price_chart 에서 추가)
+# 테마별 배경/글꼴/격자/여백/범례는 템플릿에 포함
+PRICE_CHART_LAYOUT = dict(
+    xaxis=dict(title='시간', rangeslider=dict(visible=False)),
+    yaxis=dict(title='가격 (KRW)'),
+    yaxis2=dict(
+        title='거래량',
+        overlaying='y',
+        side='right',
+        showgrid=False
+    ),
+    height=500,
+    hovermode='x unified'
+)
+
+# 신호 차트 고정 속성 (assets/performance.js 가 signals-data 로 차트를 조립할 때 사용)
+SIGNALS_STYLE = {
+    'layout': dict(
+        title='최근 10개 트레이딩 신호',
+        xaxis=dict(title='시간'),
+        yaxis=dict(title='가격 (KRW)'),
+        height=300,
+        hovermode='closest'
+    ),
+    # 매수/매도 신호 마커 및 가격 라인 두께
+    'marker_size': 15,
+    'line_width': 2
+}
+
+# 클라이언트 사이드 테마 전환용 팔레트 (assets/theme.js 에서 사용)
+THEME_PALETTE = {
+    'dark': {'colors': COLORS['dark'], 'template': pio.templates['upbit_dark'].to_plotly_json()},
+    'light': {'colors': COLORS['light'], 'template': pio.templates['upbit_light'].to_plotly_json()}
+}
+
+# 테마에 따라 바뀌는 컴포넌트 색상은 CSS 변수로 참조 (값은 assets/theme.js 가 테마별로 설정)
+CSS_COLORS = {key: f"var(--{key.replace('_', '-')}-color)" for key in COLORS['dark']}
+
+# 최근 거래 내역 테이블 컬럼과 스타일 (DataTable 하나로 전송, 색상은 CSS 변수)
+TRADE_TABLE_COLUMNS = [
+    {'name': '시간', 'id': 'time'},
+    {'name': '마켓', 'id': 'market'},
+    {'name': '종류', 'id': 'side'},
+    {'name': '체결가격', 'id': 'price'},
+    {'name': '체결수량', 'id': 'volume'},
+    {'name': '체결금액', 'id': 'total'}
+]
+TRADE_TABLE_STYLE = dict(
+    style_table={'overflowX': 'auto'},
+    style_cell={
+        'backgroundColor': CSS_COLORS['card_bg'],
+        'color': CSS_COLORS['text'],
+        'border': f"1px solid {CSS_COLORS['grid']}",
+        'fontFamily': 'inherit',
+        'padding': '8px',
+        'textAlign': 'left'
+    },
+    style_header={'fontWeight': 'bold'},
+    style_data_conditional=[
+        {'if': {'column_id': 'side', 'filter_query': '{side} = "매수"'}, 'color': CSS_COLORS['buy'], 'fontWeight': 'bold'},
+        {'if': {'column_id': 'side', 'filter_query': '{side} = "매도"'}, 'color': CSS_COLORS['sell'], 'fontWeight': 'bold'},
+        {'if': {'column_id': 'total'}, 'fontWeight': 'bold'}
+    ]
+)
+
+# 샘플 거래 데이터 알림 (샘플 데이터를 표시할 때만 포함)
+SAMPLE_NOTICE_ALERT = dbc.Alert(
+    "※ 현재 샘플 데이터가 표시되고 있습니다. 실제 거래 내역이 생성되면 자동으로 업데이트됩니다.",
+    color="warning",
+    className="mt-3 mb-0"
+)
+
+@functools.lru_cache(maxsize=4)
+def theme_context(theme_href):
+    """
+    테마 스타일시트 주소로부터 (다크 모드 여부, 색상 팔레트)를 반환합니다.
+    """
+    is_dark = theme_href != THEMES['LIGHT']
+    return is_dark, COLORS['dark' if is_dark else 'light']
+
+# 테마별 스타일 생성
+def _build_styles(theme):
+    theme_key = 'dark' if theme == 'DARK' else 'light'
     colors = COLORS[theme_key]
     
     return {
@@ -146,6 +420,13 @@ def get_current_styles():
         }
     }
 
+# 테마별 스타일은 고정이므로 임포트 시 한 번만 생성
+_STYLES_CACHE = {theme: _build_styles(theme) for theme in THEMES}
+
+# 테마별 스타일 가져오기 (미리 만들어 둔 dict 를 그대로 반환)
+def get_styles(theme):
+    return _STYLES_CACHE[theme]
+
 def get_available_markets():
     """
     거래 가능한 마켓 목록을 반환합니다.
@@ -159,10 +440,7 @@ def initialize_data():
         'balances': {},
         'trades': [],
         'market_data': {},
-        'performance': {
-            'dates': [],
-            'pnl': []
-        }
+        'performance': PerfRing()
     }
     
     # 기본 시장 데이터 채우기
@@ -172,8 +450,15 @@ def initialize_data():
             'signals': []
         }
 
-# 현재 스타일 가져오기
-STYLES = get_current_styles()
+def numeric_column(df, *columns):
+    """
+    앞선 컬럼부터 숫자로 변환해 비어 있는 값을 다음 컬럼으로 채웁니다. (모두 없으면 0)
+    """
+    values = pd.Series(np.nan, index=df.index)
+    for column in columns:
+        if column in df:
+            values = values.fillna(pd.to_numeric(df[column], errors='coerce'))
+    return values.fillna(0).to_numpy()
 
 # Header with title and controls
 def create_header():
@@ -193,12 +478,12 @@ def create_header():
                 ], className="d-flex justify-content-center")
             ], width=12, lg=4)
         ])
-    ], id='header', style=STYLES['header'])
+    ], id='header', style=get_styles(current_theme)['header'])
 
 # Trading status
 def create_trading_status():
     return dbc.Alert(
-        "트레이딩 상태: 중지됨", 
+        STATUS_STOPPED, 
         id="trading-status",
         color="warning",
         className="text-center fw-bold my-4",
@@ -289,6 +574,103 @@ def create_performance_card():
     ], className="mb-4 shadow-sm")
 
 # 트레이딩 전략 정보 카드
+# 거래 전략 설명 (내용이 고정이므로 카드는 임포트 시 한 번만 생성)
+STRATEGIES = [
+    {
+        'name': 'SMA 교차 전략',
+        'description': '단기(3일선)가 장기(10일선)를 상향돌파하면 매수, 하향돌파하면 매도',
+        'params': {
+            '단기 이동평균': '3일',
+            '장기 이동평균': '10일',
+            '시그널 체크': '크로스오버 감지'
+        }
+    },
+    {
+        'name': 'RSI 전략',
+        'description': 'RSI 지표가 과매도 영역에서 반등 시 매수, 과매수 영역에서 하락 시 매도',
+        'params': {
+            '기간': '8일', 
+            '과매수 기준': '80 이상',
+            '과매도 기준': '20 이하'
+        }
+    },
+    {
+        'name': '볼린저 밴드 전략',
+        'description': '가격이 하단밴드 아래로 내려가면 매수, 상단밴드 위로 올라가면 매도',
+        'params': {
+            '이동평균 기간': '10일',
+            '표준편차 배수': '2.5',
+            '밴드 폭': '밴드폭 기준 거래 없음'
+        }
+    }
+]
+
+# 리스크 관리 정보 (거래 활성화 여부는 trading-enabled 스토어로 갱신)
+RISK_MANAGEMENT = {
+    'profit_target': '5%',  # 익절 목표
+    'stop_loss': '3%',       # 손절 기준
+    'max_position': '계정 잔액의 100%',  # 최대 포지션 크기
+    'min_order': '5,000원'  # 최소 주문 금액
+}
+
+def create_strategy_info():
+    """리스크 관리 및 개별 전략 카드 목록 생성"""
+    # 리스크 관리 카드 생성
+    risk_card = dbc.Card([
+        dbc.CardHeader(html.H6("리스크 관리 설정", className="m-0 fw-bold text-primary")),
+        dbc.CardBody([
+            dbc.Row([
+                dbc.Col([
+                    html.P([
+                        html.Span("익절 목표: ", className="text-muted"),
+                        html.Span(RISK_MANAGEMENT['profit_target'], className="fw-bold")
+                    ], className="mb-2"),
+                    html.P([
+                        html.Span("손절 기준: ", className="text-muted"),
+                        html.Span(RISK_MANAGEMENT['stop_loss'], className="fw-bold")
+                    ], className="mb-2"),
+                ], width=6),
+                dbc.Col([
+                    html.P([
+                        html.Span("최대 포지션: ", className="text-muted"),
+                        html.Span(RISK_MANAGEMENT['max_position'], className="fw-bold")
+                    ], className="mb-2"),
+                    html.P([
+                        html.Span("최소 주문액: ", className="text-muted"),
+                        html.Span(RISK_MANAGEMENT['min_order'], className="fw-bold")
+                    ], className="mb-2"),
+                    html.P([
+                        html.Span("거래 활성화: ", className="text-muted"),
+                        # 내용/색상은 assets/ui.js 의 trading_badge 가 설정
+                        html.Span(id="trading-enabled-badge", className="fw-bold")
+                    ], className="mb-0"),
+                ], width=6),
+            ]),
+        ])
+    ], className="mb-3 shadow-sm")
+    
+    # 개별 전략 카드 생성
+    strategy_cards = [
+        dbc.Card([
+            dbc.CardHeader(html.H6(strategy['name'], className="m-0 fw-bold text-primary")),
+            dbc.CardBody([
+                html.P(strategy['description'], className="mb-3 small"),
+                html.Div([
+                    dbc.Row([
+                        dbc.Col([
+                            html.Span(key + ": ", className="text-muted small"),
+                            html.Span(value, className="fw-bold small")
+                        ], width="auto", className="me-3 mb-2")
+                        for key, value in strategy['params'].items()
+                    ], className="g-0")
+                ])
+            ])
+        ], className="mb-3 shadow-sm")
+        for strategy in STRATEGIES
+    ]
+    
+    return [risk_card] + strategy_cards
+
 def create_strategy_card():
     """트레이딩 전략 정보 카드 생성"""
     return dbc.Card([
@@ -308,10 +690,20 @@ def create_strategy_card():
                 )
             ], align="center")
         ),
-        dbc.CardBody(html.Div(id='strategy-info', className="p-0")),
+        dbc.CardBody(html.Div(create_strategy_info(), id='strategy-info', className="p-0")),
         dbc.Tooltip("전략 정보 새로고침", target="refresh-strategy-btn")
     ], className="mb-4 shadow-sm")
 
+# 카드 컴포넌트 트리는 내용이 고정이므로 임포트 시 한 번만 생성
+HEADER = create_header()
+TRADING_STATUS_ALERT = create_trading_status()
+ACCOUNT_CARD = create_account_card()
+STRATEGY_CARD = create_strategy_card()
+MARKET_CARD = create_market_card()
+PERFORMANCE_CARD = create_performance_card()
+SIGNALS_CARD = create_signals_card()
+TRADES_CARD = create_trades_card()
+
 # Layout with responsive grid
 def create_layout():
     return html.Div([
@@ -323,11 +715,55 @@ def create_layout():
             rel='stylesheet',
             href=THEMES[current_theme]
         ),
+        dcc.Store(id='theme-palette', data=THEME_PALETTE),
+        dcc.Store(id='theme-vars'),
+        
+        # Upbit 조회 결과 갱신 알림 (데이터 본문은 서버 data_cache 에 보관)
+        dcc.Store(id='upbit-snapshot'),
+        
+        # 계좌 정보 카드 데이터 (assets/ui.js 에서 렌더링)
+        dcc.Store(id='balances-json'),
+        
+        # 성능 차트 데이터 (assets/performance.js 에서 차트로 조립)
+        dcc.Store(id='performance-data'),
+        dcc.Store(id='performance-style', data=PERFORMANCE_STYLE),
         
-        # 주기적 업데이트를 위한 interval 컴포넌트 (5초마다)
+        # 신호 차트 데이터 (assets/performance.js 에서 차트로 조립)
+        dcc.Store(id='signals-data'),
+        dcc.Store(id='signals-style', data=SIGNALS_STYLE),
+        
+        # 가격 차트에 그려진 마켓 (증분 Patch 여부 판단용)
+        dcc.Store(id='price-rendered'),
+        
+        # 탭이 보일 때만 전달되는 interval 틱 (assets/poll.js)
+        dcc.Store(id='live-tick'),
+        
+        # 트레이딩 엔진 거래 활성화 여부 (전략 카드 배지, assets/ui.js)
+        dcc.Store(id='trading-enabled'),
+        
+        # 화면에 보이는 카드 id 목록 (assets/poll.js 의 IntersectionObserver, None 이면 모두 갱신)
+        dcc.Store(id='visible-cards'),
+        # 성능 차트 카드의 가시성만 따로 보관 (다른 카드의 스크롤에는 반응하지 않음)
+        dcc.Store(id='performance-visible'),
+        
+        # 주기적 업데이트를 위한 interval 컴포넌트 (DASHBOARD_CONFIG['poll_interval_ms'])
         dcc.Interval(
             id='interval-component',
-            interval=5 * 1000,  # 5초마다 실행 (밀리초 단위)
+            interval=POLL_INTERVAL_MS,  # 밀리초 단위
+            n_intervals=0
+        ),
+        
+        # 성능 차트용 느린 interval (DASHBOARD_CONFIG['slow_poll_interval_ms'])
+        dcc.Interval(
+            id='interval-slow',
+            interval=SLOW_POLL_INTERVAL_MS,
+            n_intervals=0
+        ),
+        
+        # 전략 카드 거래 활성화 배지용 interval (DASHBOARD_CONFIG['static_poll_interval_ms'])
+        dcc.Interval(
+            id='interval-static',
+            interval=STATIC_POLL_INTERVAL_MS,
             n_intervals=0
         ),
         
@@ -339,44 +775,44 @@ def create_layout():
         
         # Main container
         dbc.Container([
-            create_header(),
-            create_trading_status(),
+            HEADER,
+            TRADING_STATUS_ALERT,
             
             # Top row (Account and Strategy info)
             dbc.Row([
                 dbc.Col([
-                    create_account_card(),
+                    ACCOUNT_CARD,
                 ], width=12, lg=8),
                 dbc.Col([
-                    create_strategy_card(),
+                    STRATEGY_CARD,
                 ], width=12, lg=4),
             ], className="mb-4"),
             
             # Market data row
             dbc.Row([
                 dbc.Col([
-                    create_market_card(),
+                    MARKET_CARD,
                 ], width=12)
             ], className="mb-4"),
             
             # Performance and signals row
             dbc.Row([
                 dbc.Col([
-                    create_performance_card(),
+                    PERFORMANCE_CARD,
                 ], width=12, lg=8),
                 dbc.Col([
-                    create_signals_card(),
+                    SIGNALS_CARD,
                 ], width=12, lg=4),
             ], className="mb-4"),
             
             # Recent trades row
             dbc.Row([
                 dbc.Col([
-                    create_trades_card()
+                    TRADES_CARD
                 ], width=12)
             ])
         ], fluid=True, className="py-3", id="main-container")
-    ], id="main-content", style=STYLES['page'])
+    ], id="main-content", style=get_styles(current_theme)['page'])
 
 # 에러 메시지 컴포넌트 생성 함수
 def create_error_message(message):
@@ -390,45 +826,126 @@ def create_error_message(message):
         dismissable=True
     )
 
-# 계좌 정보 수동 새로고침 콜백 추가
+def _fetch_snapshot_part(name, func, *args, **kwargs):
+    """
+    스냅샷 항목 하나를 조회합니다. 실패 시 로그를 남기고 None 을 반환합니다.
+    """
+    try:
+        return func(*args, **kwargs)
+    except Exception as e:
+        logger.error("%s 조회 중 오류 발생: %s", name, e)
+        return None
+
+def snapshot_unchanged(snapshot, part):
+    """
+    upbit-snapshot 갱신으로만 호출됐는데 part 항목은 바뀌지 않았으면 True 를 반환합니다.
+    """
+    triggered = [trigger['prop_id'] for trigger in dash.callback_context.triggered]
+    return bool(snapshot) and triggered == ['upbit-snapshot.data'] and part not in snapshot.get('changed', ())
+
+def card_visible(visible_cards, card_id):
+    """
+    card_id 카드가 화면에 보이는지 확인합니다. 가시성 정보가 아직 없으면 보이는 것으로 간주합니다.
+    """
+    return visible_cards is None or card_id in visible_cards
+
+# 탭이 숨겨진 동안에는 Upbit 조회 주기를 건너뜀
+app.clientside_callback(
+    ClientsideFunction(namespace='poll', function_name='visible_tick'),
+    Output('live-tick', 'data'),
+    Input('interval-component', 'n_intervals')
+)
+
+# 스크롤로 화면 밖에 있는 무거운 카드는 갱신하지 않도록 보이는 카드 목록을 기록
+app.clientside_callback(
+    ClientsideFunction(namespace='poll', function_name='visible_cards'),
+    Output('visible-cards', 'data'),
+    Input('interval-component', 'n_intervals'),
+    State('visible-cards', 'data')
+)
+
+# 성능 차트 가시성이 바뀔 때만 performance-visible 갱신
+app.clientside_callback(
+    ClientsideFunction(namespace='poll', function_name='performance_visible'),
+    Output('performance-visible', 'data'),
+    Input('visible-cards', 'data'),
+    State('performance-visible', 'data')
+)
+
+# Upbit 데이터 일괄 조회 콜백 (표시용 콜백들은 upbit-snapshot 갱신에 반응)
 @app.callback(
-    Output('account-balance', 'children'),
-    [Input('interval-component', 'n_intervals'),
+    Output('upbit-snapshot', 'data'),
+    [Input('live-tick', 'data'),
      Input('refresh-account-btn', 'n_clicks'),
-     Input('theme-stylesheet', 'href')]
+     Input('market-dropdown', 'value')],
+    [State('upbit-snapshot', 'data')]
 )
-def update_account_balance(n_intervals, n_clicks, theme_href):
-    # 테마에 따른 스타일 결정
-    is_dark_theme = 'DARKLY' in theme_href if theme_href else True
-    color_theme = 'dark' if is_dark_theme else 'light'
-    colors = COLORS[color_theme]
+def update_upbit_snapshot(tick, n_clicks, selected_market, previous):
+    """
+    계좌, 거래 내역, 캔들, 비트코인 티커를 병렬로 조회해 data_cache 에 저장합니다.
+    이전 조회와 달라진 항목만 changed 로 알리고, 바뀐 것이 없으면 갱신하지 않습니다.
+    """
+    ctx = dash.callback_context
+    is_refresh_button_clicked = ctx.triggered_id == 'refresh-account-btn'
+    if is_refresh_button_clicked:
+        # 수동 새로고침 버튼이 클릭된 경우 계정 정보 강제 갱신
+        logger.info("계정 정보 수동 새로고침 요청됨")
     
-    # 새로고침 버튼 클릭 체크 (callback_context 없이 직접 n_clicks 검사)
-    is_refresh_button_clicked = False
-    try:
-        # n_clicks가 None이 아니고 변경되었을 때 (1 이상일 때) 새로고침 버튼 클릭으로 간주
-        if n_clicks is not None and n_clicks > 0:
-            is_refresh_button_clicked = True
-            # 클릭 이벤트 처리 후 n_clicks 초기화를 위해 
-            # dash.no_update 반환 (이 방식은 실제로는 작동하지 않음 - 단순 참고용)
-    except Exception as e:
-        logger.error(f"새로고침 버튼 클릭 확인 중 오류 발생: {str(e)}")
+    futures = {
+        'accounts': snapshot_executor.submit(
+            _fetch_snapshot_part, '계정 정보',
+            api.refresh_accounts if is_refresh_button_clicked else api.get_accounts
+        ),
+        'trades': snapshot_executor.submit(
+            _fetch_snapshot_part, '거래 내역',
+            cached_order_history, 'KRW-BTC', 'done', 5
+        ),
+        'btc_ticker': snapshot_executor.submit(_fetch_snapshot_part, '비트코인 티커', cached_ticker, 'KRW-BTC')
+    }
+    if selected_market:
+        futures['candles'] = snapshot_executor.submit(
+            _fetch_snapshot_part, '캔들 데이터',
+            api.get_candles, selected_market, 'minutes', 200, 1
+        )
+    results = {name: future.result() for name, future in futures.items()}
+    
+    data_cache['balances'] = {'accounts': results['accounts']}
+    data_cache['trades'] = results['trades'] or []
+    market_data = data_cache['market_data']
+    market_data.setdefault('KRW-BTC', {})['ticker'] = results['btc_ticker']
+    if selected_market:
+        market_data.setdefault(selected_market, {})['candles'] = results['candles']
+    
+    # 항목별 응답 서명으로 실제로 바뀐 데이터만 표시 콜백에 알림
+    # (브라우저를 거쳐 돌아오는 값이므로 float64 로 반올림되는 큰 정수 대신 16자리 hex 문자열 사용)
+    signatures = {
+        name: hashlib.blake2b(orjson.dumps(value), digest_size=8).hexdigest()
+        for name, value in results.items()
+    }
+    previous_signatures = previous.get('signatures', {}) if previous else {}
+    changed = [name for name, signature in signatures.items() if previous_signatures.get(name) != signature]
+    if is_refresh_button_clicked and 'accounts' not in changed:
+        changed.append('accounts')
+    if not changed:
+        raise PreventUpdate
     
-    # API 호출 시도
+    return {'market': selected_market, 'signatures': signatures, 'changed': changed}
+
+# 계좌 정보 데이터 콜백 (카드 렌더링은 assets/ui.js 에서 수행)
+@app.callback(
+    Output('balances-json', 'data'),
+    [Input('upbit-snapshot', 'data')]
+)
+def update_account_balance(snapshot):
     try:
-        if is_refresh_button_clicked:
-            # 수동 새로고침 버튼이 클릭된 경우 계정 정보 강제 갱신
-            logger.info("계정 정보 수동 새로고침 요청됨")
-            accounts = api.refresh_accounts()
-        else:
-            # 일반적인 인터벌 업데이트
-            accounts = api.get_accounts()
+        # 더미 계정 추가가 캐시를 오염시키지 않도록 복사본 사용
+        accounts = list(data_cache['balances'].get('accounts') or [])
         
         if not accounts:
-            return dbc.Alert("계정 정보를 불러올 수 없습니다. API 연결을 확인해주세요.", color="danger", className="m-0")
+            return {'alert': "계정 정보를 불러올 수 없습니다. API 연결을 확인해주세요.", 'color': "danger"}
 
-        # 계좌 정보를 카드로 표시
-        account_cards = []
+        # 카드로 표시할 계좌 정보
+        account_rows = []
         
         # 모든 화폐 표시로 변경
         all_currencies = set(account['currency'] for account in accounts)
@@ -442,7 +959,7 @@ def update_account_balance(n_intervals, n_clicks, theme_href):
         # 계정에 없는 항상 표시할 코인을 위한 더미 계정 생성
         for currency in always_show_currencies:
             if currency not in all_currencies:
-                logger.info(f"{currency} 계정을 찾을 수 없어 더미 계정을 생성합니다.")
+                logger.info("%s 계정을 찾을 수 없어 더미 계정을 생성합니다.", currency)
                 accounts.append({
                     'currency': currency,
                     'balance': '0.0',
@@ -451,6 +968,24 @@ def update_account_balance(n_intervals, n_clicks, theme_href):
                     'avg_buy_price_modified': True
                 })
         
+        # 표시할 코인의 티커를 한 번의 요청으로 미리 조회
+        ticker_markets = tuple(sorted({
+            f"KRW-{account['currency']}" if not account['currency'].startswith("KRW-") else account['currency']
+            for account in accounts
+            if account['currency'] != 'KRW' and account['currency'] not in excluded_currencies
+            and (account['currency'] in always_show_currencies or float(account['balance']) > 0)
+        }))
+        tickers = _fetch_snapshot_part('티커', cached_tickers, ticker_markets) if ticker_markets else {}
+        if ticker_markets and not tickers:
+            # 상장 폐지 등으로 일괄 조회가 실패하면 마켓별로 병렬 조회
+            tickers = {
+                market: ticker[0]
+                for market, ticker in zip(ticker_markets, snapshot_executor.map(
+                    functools.partial(_fetch_snapshot_part, '티커', cached_ticker), ticker_markets
+                ))
+                if ticker
+            }
+        
         for account in accounts:
             try:
                 currency = account['currency']
@@ -474,23 +1009,9 @@ def update_account_balance(n_intervals, n_clicks, theme_href):
                     profit_loss = 0
                     icon = "💰"
                 else:
-                    ticker_info = None
-                    try:
-                        # 티커 형식 확인 및 자동으로 KRW- 접두사 추가
-                        market_id = f"KRW-{currency}" if not currency.startswith("KRW-") else currency
-                        ticker = api.get_ticker(market_id)
-                        
-                        if ticker and len(ticker) > 0:
-                            ticker_info = ticker[0]
-                            logger.info(f"{currency} 티커 조회 성공: {ticker_info['trade_price']}")
-                    except Exception as ticker_err:
-                        logger.error(f"티커 조회 오류 ({currency}): {ticker_err}")
-                    
-                    # 기본 가격 정보 (API 연결 실패 시 사용)
-                    default_prices = {
-                        'BTC': 127000000,
-                        'ETH': 5000000
-                    }
+                    # 티커 형식 확인 및 자동으로 KRW- 접두사 추가
+                    market_id = f"KRW-{currency}" if not currency.startswith("KRW-") else currency
+                    ticker_info = tickers.get(market_id)
                     
                     # 화폐별 아이콘 설정
                     if currency == 'BTC':
@@ -500,221 +1021,125 @@ def update_account_balance(n_intervals, n_clicks, theme_href):
                     else:
                         icon = "🪙"
                     
-                    # 티커 정보를 가져오지 못한 경우 기본 가격 사용
-                    if not ticker_info:
-                        if currency in default_prices:
-                            logger.info(f"{currency} 티커 정보 사용 불가, 기본 가격 사용: {default_prices[currency]}")
-                            current_price = default_prices[currency]
-                        else:
-                            current_price = avg_buy_price or 0
-                            logger.warning(f"{currency} 티커 및 기본 가격 정보 없음, 평균 매수가 사용: {current_price}")
-                        
-                        total = (balance + locked) * current_price
-                        profit_loss = total - ((balance + locked) * avg_buy_price)
-                    else:
-                        current_price = float(ticker_info['trade_price'])
-                        total = (balance + locked) * current_price
-                        profit_loss = total - ((balance + locked) * avg_buy_price)
-                
-                # 손익에 따른 색상 설정
-                profit_loss_color = colors['buy'] if profit_loss > 0 else colors['sell'] if profit_loss < 0 else colors['text']
+                    # 티커 정보를 가져오지 못한 경우 (일괄/개별 조회 모두 실패) 평균 매수가로 평가
+                    current_price = float(ticker_info['trade_price']) if ticker_info else avg_buy_price
+                    total = (balance + locked) * current_price
+                    profit_loss = total - ((balance + locked) * avg_buy_price)
                 
-                # 카드 생성
-                account_card = dbc.Card([
-                    dbc.CardBody([
-                        html.Div([
-                            html.Span(icon, className="me-2 fs-4"),
-                            html.Span(currency, className="fs-4 fw-bold")
-                        ], className="d-flex align-items-center mb-3"),
-                        
-                        html.Div([
-                            html.P([
-                                html.Span("보유량: ", className="text-muted"),
-                                html.Span(f"{balance:.8f}", className="fw-bold")
-                            ], className="mb-2"),
-                            
-                            # 보유량+잠금 표시
-                            html.P([
-                                html.Span("잠금: ", className="text-muted"),
-                                html.Span(f"{locked:.8f}", className="fw-bold")
-                            ], className="mb-2") if locked > 0 else None,
-                            
-                            html.P([
-                                html.Span("평가금액: ", className="text-muted"),
-                                html.Span(f"{total:,.0f} KRW", className="fw-bold")
-                            ], className="mb-2"),
-                            
-                            html.P([
-                                html.Span("평균단가: ", className="text-muted"),
-                                html.Span(f"{avg_buy_price:,.0f} KRW", 
-                                         className="fw-bold" if currency != "KRW" else "")
-                            ], className="mb-2"),
-                            
-                            html.P([
-                                html.Span("평가손익: ", className="text-muted"),
-                                html.Span(f"{profit_loss:,.0f} KRW", 
-                                         className="fw-bold fs-5",
-                                         style={
-                                             "color": "#FFFFFF",  # 항상 흰색으로 강제 설정
-                                             "text-shadow": "0px 0px 2px rgba(0,0,0,0.9)"
-                                         })
-                            ], className="mb-0")
-                        ])
-                    ], className="p-3")
-                ], className="mb-3 h-100 shadow-sm")
-                
-                account_cards.append(account_card)
+                account_rows.append({
+                    'currency': currency,
+                    'icon': icon,
+                    'balance': balance,
+                    'locked': locked,
+                    'total': total,
+                    'avg_buy_price': avg_buy_price,
+                    'profit_loss': profit_loss
+                })
                 
             except Exception as e:
-                logger.error(f"계정 데이터 처리 중 오류 발생: {str(e)}")
+                logger.error("계정 데이터 처리 중 오류 발생: %s", e)
                 continue
 
-        if not account_cards:
-            return dbc.Alert("처리 가능한 계정 정보가 없습니다.", color="warning", className="m-0")
+        if not account_rows:
+            return {'alert': "처리 가능한 계정 정보가 없습니다.", 'color': "warning"}
 
-        # 계좌 정보 그리드 레이아웃
-        return dbc.Row([
-            dbc.Col(card, width=12, md=6) for card in account_cards
-        ], className="g-3")
+        return {'accounts': account_rows}
 
     except requests.exceptions.Timeout:
         logger.error("계정 정보 조회 중 타임아웃 발생")
-        return dbc.Alert("서버 응답 시간이 초과되었습니다. 다시 시도해주세요.", color="danger", className="m-0")
+        return {'alert': "서버 응답 시간이 초과되었습니다. 다시 시도해주세요.", 'color': "danger"}
         
     except requests.exceptions.ConnectionError:
         logger.error("계정 정보 조회 중 연결 오류 발생")
-        return dbc.Alert("서버 연결에 실패했습니다. 인터넷 연결을 확인해주세요.", color="danger", className="m-0")
+        return {'alert': "서버 연결에 실패했습니다. 인터넷 연결을 확인해주세요.", 'color': "danger"}
         
     except Exception as e:
-        logger.error(f"계정 정보 업데이트 중 오류 발생: {str(e)}")
-        traceback.print_exc()
-        return dbc.Alert(
-            f"계정 정보를 불러오는 중 오류가 발생했습니다: {str(e)[:100]}", 
-            color="danger",
-            className="m-0"
-        )
+        logger.exception("계정 정보 업데이트 중 오류 발생: %s", e)
+        return {'alert': f"계정 정보를 불러오는 중 오류가 발생했습니다: {str(e)[:100]}", 'color': "danger"}
+
+# 계좌 정보 카드 렌더링 (브라우저에서 JSON -> 컴포넌트 조립)
+app.clientside_callback(
+    ClientsideFunction(namespace='ui', function_name='render_balances'),
+    Output('account-balance', 'children'),
+    Input('balances-json', 'data')
+)
 
 # 거래 내역 업데이트
 @app.callback(
     Output('recent-trades', 'children'),
-    [Input('interval-component', 'n_intervals'),
-     Input('theme-stylesheet', 'href')]
+    [Input('upbit-snapshot', 'data'),
+     Input('visible-cards', 'data')]
 )
-def update_recent_trades(n, theme_href):
-    # 테마에 따른 스타일 결정
-    is_dark_theme = 'DARKLY' in theme_href if theme_href else True
-    color_theme = 'dark' if is_dark_theme else 'light'
-    colors = COLORS[color_theme]
+def update_recent_trades(snapshot, visible_cards):
+    # 화면 밖이면 건너뛰고, 다시 보이게 되면 visible-cards 갱신으로 그림
+    if not card_visible(visible_cards, 'recent-trades') or snapshot_unchanged(snapshot, 'trades'):
+        raise PreventUpdate
     
     try:
-        trades = api.get_order_history(market='KRW-BTC', state='done', count=5)
+        trades = data_cache['trades']
         
         # 거래 내역이 없는 경우 샘플 데이터 생성
         if not trades:
             logger.info("거래 내역이 없어 샘플 데이터로 표시합니다.")
             # 샘플 거래 데이터 생성
-            sample_trades = [
-                {
-                    'created_at': (datetime.now() - timedelta(hours=i)).isoformat(),
-                    'market': 'KRW-BTC',
-                    'side': 'bid' if i % 2 == 0 else 'ask',
-                    'price': 50000000 * (1 + (i * 0.001)),
-                    'volume': 0.0005 * (1 + (i * 0.1)),
-                    'trades_price': 50000000 * (1 + (i * 0.002)),
-                    'executed_volume': 0.0004 * (1 + (i * 0.05)),
-                    'is_sample': True  # 샘플 데이터 표시
-                } for i in range(5)
-            ]
-            trades = sample_trades
+            i = np.arange(5)
+            trades = pd.DataFrame({
+                'created_at': pd.Timestamp.now(tz=KST) - pd.to_timedelta(i, unit='h'),
+                'market': 'KRW-BTC',
+                'side': np.where(i % 2 == 0, 'bid', 'ask'),
+                'price': 50000000 * (1 + i * 0.001),
+                'volume': 0.0005 * (1 + i * 0.1),
+                'trades_price': 50000000 * (1 + i * 0.002),
+                'executed_volume': 0.0004 * (1 + i * 0.05),
+                'is_sample': True  # 샘플 데이터 표시
+            })
+        else:
+            trades = pd.DataFrame(trades)
+        
+        # 거래 시간 변환 (UTC to KST), 날짜가 없거나 잘못된 경우 현재 시간 사용
+        created_at = trades['created_at'] if 'created_at' in trades else pd.Series(pd.NaT, index=trades.index)
+        trade_times = (
+            pd.to_datetime(created_at, utc=True, errors='coerce', format='ISO8601')
+            .dt.tz_convert(KST)
+            .fillna(pd.Timestamp.now(tz=KST))
+            .dt.strftime("%Y-%m-%d %H:%M:%S")
+            .to_numpy()
+        )
         
-        # 거래 내역 테이블
-        headers = [
-            "시간", "마켓", "종류", "체결가격", "체결수량", "체결금액"
+        # 체결가격/수량 (trades_price/executed_volume 이 없으면 price/volume, 둘 다 없으면 0)
+        prices = numeric_column(trades, 'trades_price', 'price')
+        volumes = numeric_column(trades, 'executed_volume', 'volume')
+        totals = prices * volumes
+        markets_col = trades['market'].fillna('N/A').to_numpy() if 'market' in trades else np.full(len(trades), 'N/A')
+        sides = trades['side'].to_numpy() if 'side' in trades else np.full(len(trades), '')
+        has_sample_data = bool(trades['is_sample'].fillna(False).any()) if 'is_sample' in trades else False
+        
+        # 거래 종류 및 수익률 계산 (매도는 +, 매수는 -)
+        is_bid = sides == 'bid'
+        total_profit_loss = float(np.where(is_bid, -totals, totals).sum())
+        
+        # 행 데이터 (테마 색상은 TRADE_TABLE_STYLE 의 조건부 스타일로 지정)
+        records = [
+            {
+                'time': trade_time,
+                'market': market,
+                'side': "매수" if bid else "매도",
+                'price': f"{price:,.0f}",
+                'volume': f"{volume:.8f}",
+                'total': f"{total:,.0f}"
+            }
+            for trade_time, market, bid, price, volume, total in zip(
+                trade_times, markets_col, is_bid.tolist(), prices.tolist(), volumes.tolist(), totals.tolist())
         ]
-        
-        rows = []
-        total_profit_loss = 0
-        has_sample_data = False
-        
-        for trade in trades:
-            try:
-                # 샘플 데이터 표시 여부 확인
-                if trade.get('is_sample', False):
-                    has_sample_data = True
-                
-                # 안전하게 데이터 추출
-                # 날짜가 없는 경우 현재 시간 사용
-                created_at = trade.get('created_at', datetime.now().isoformat())
-                try:
-                    # 거래 시간 변환 (UTC to KST)
-                    trade_time = datetime.fromisoformat(created_at.replace('Z', '+00:00'))
-                    trade_time = trade_time.astimezone(timezone(timedelta(hours=9)))  # UTC+9 (KST)
-                except Exception as e:
-                    logger.error(f"날짜 변환 오류: {str(e)}")
-                    trade_time = datetime.now()  # 오류 시 현재 시간 사용
-                
-                # 거래 정보 추출 (기본값 사용)
-                market = trade.get('market', 'N/A')
-                side = "매수" if trade.get('side', '') == 'bid' else "매도"
-                
-                # 가격 및 수량 안전하게 추출
-                try:
-                    # 체결가격 (trades_price가 없는 경우 price 사용, 둘 다 없으면 0)
-                    price = float(trade.get('trades_price', trade.get('price', 0)))
-                    volume = float(trade.get('executed_volume', trade.get('volume', 0)))
-                    total = price * volume
-                except (ValueError, TypeError) as e:
-                    logger.error(f"가격/수량 변환 오류: {str(e)}")
-                    price = 0
-                    volume = 0
-                    total = 0
-
-                # 거래 종류에 따른 스타일
-                side_color = colors['buy'] if side == "매수" else colors['sell']
-
-                # 행 데이터
-                row = [
-                    trade_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    market,
-                    html.Span(side, style={"color": side_color, "fontWeight": "bold"}),
-                    f"{price:,.0f}",
-                    f"{volume:.8f}",
-                    html.Span(f"{total:,.0f}", style={"fontWeight": "bold"})
-                ]
-                rows.append(row)
-
-                # 수익률 계산을 위한 누적
-                if side == "매도":
-                    total_profit_loss += total
-                else:
-                    total_profit_loss -= total
 
-            except Exception as e:
-                logger.error(f"거래 데이터 처리 중 오류 발생: {str(e)}, 데이터: {trade}")
-                continue
-
-        if not rows:
+        if not records:
             return dbc.Alert("거래 내역을 처리할 수 없습니다.", color="warning", className="m-0")
 
         # 거래 내역 테이블 생성
-        table = dbc.Table(
-            # 헤더
-            [html.Thead(html.Tr([html.Th(h) for h in headers], className="table-light"))] +
-            # 바디
-            [html.Tbody([html.Tr([html.Td(cell) for cell in row]) for row in rows])],
-            striped=True,
-            bordered=True,
-            hover=True,
-            responsive=True,
-            className="mb-0"
-        )
-
-        # 샘플 데이터 알림
-        sample_notice = dbc.Alert(
-            "※ 현재 샘플 데이터가 표시되고 있습니다. 실제 거래 내역이 생성되면 자동으로 업데이트됩니다.",
-            color="warning",
-            className="mt-3 mb-0",
-            style={"display": "block" if has_sample_data else "none"}
+        table = dash_table.DataTable(
+            data=records,
+            columns=TRADE_TABLE_COLUMNS,
+            **TRADE_TABLE_STYLE
         )
 
         # 수익률 요약
@@ -728,10 +1153,14 @@ def update_recent_trades(n, theme_href):
             className="mt-3 mb-0 text-center"
         )
 
-        return html.Div([table, profit_loss_summary, sample_notice])
+        # 샘플 데이터 알림은 필요할 때만 전송
+        children = [table, profit_loss_summary]
+        if has_sample_data:
+            children.append(SAMPLE_NOTICE_ALERT)
+        return html.Div(children)
 
     except Exception as e:
-        logger.error(f"거래 내역 업데이트 중 오류 발생: {str(e)}")
+        logger.exception("거래 내역 업데이트 중 오류 발생: %s", e)
         return dbc.Alert(
             f"거래 내역을 불러오는 중 오류가 발생했습니다: {str(e)[:100]}", 
             color="danger",
@@ -742,121 +1171,57 @@ def update_recent_trades(n, theme_href):
 @app.callback(
     [Output('price-chart', 'figure'),
      Output('current-price', 'children'),
-     Output('market-stats', 'children')],
-    [Input('interval-component', 'n_intervals'),
-     Input('market-dropdown', 'value'),
-     Input('theme-stylesheet', 'href')]
+     Output('market-stats', 'children'),
+     Output('price-rendered', 'data')],
+    [Input('upbit-snapshot', 'data'),
+     Input('visible-cards', 'data')],
+    [State('theme-stylesheet', 'href'),
+     State('price-rendered', 'data')]
 )
-def update_price_chart(n, selected_market, theme_href):
+def update_price_chart(snapshot, visible_cards, theme_href, rendered):
+    selected_market = snapshot.get('market') if snapshot else None
+    if not card_visible(visible_cards, 'price-chart') or snapshot_unchanged(snapshot, 'candles'):
+        raise PreventUpdate
     if not selected_market:
-        return create_empty_figure(), "", ""
+        return create_empty_figure(), "", "", None
         
     try:
         # 테마에 따른 스타일 결정
-        is_dark_theme = 'DARKLY' in theme_href if theme_href else True
-        color_theme = 'dark' if is_dark_theme else 'light'
-        colors = COLORS[color_theme]
+        is_dark_theme, colors = theme_context(theme_href)
         
         # 데이터 가져오기
-        candles = api.get_candles(selected_market, 'minutes', 200, 1)
+        candles = data_cache['market_data'].get(selected_market, {}).get('candles')
         if not candles:
-            return create_empty_figure("데이터를 가져올 수 없습니다"), "", ""
+            return create_empty_figure("데이터를 가져올 수 없습니다"), "", "", None
             
-        # DataFrame 생성
-        df = pd.DataFrame(candles)
-        df['date'] = pd.to_datetime(df['candle_date_time_kst'])
-        df = df.set_index('date')
-        
-        # 데이터 준비
-        dates = df.index
-        opens = df['opening_price']
-        highs = df['high_price']
-        lows = df['low_price']
-        closes = df['trade_price']
-        volumes = df['candle_acc_trade_volume']
+        # 시간순 구조화 배열로 변환 (응답은 최신순, pandas 를 거치지 않음)
+        candles = candles_to_array(candles)
+        opens = candles['open']
+        highs = candles['high']
+        lows = candles['low']
+        closes = candles['close']
         
         # 현재 가격 및 변동률 계산
-        current_price = closes.iloc[-1]
-        prev_price = closes.iloc[-2]
+        current_price = closes[-1]
+        prev_price = closes[-2]
         price_change = ((current_price - prev_price) / prev_price) * 100
         
         # 거래량 색상 설정
-        vol_color = colors['buy'] if closes.iloc[-1] >= opens.iloc[-1] else colors['sell']
-        
-        # 차트 생성
-        fig = go.Figure()
-        
-        # 캔들스틱 추가
-        fig.add_trace(
-            go.Candlestick(
-                x=dates,
-                open=opens,
-                high=highs,
-                low=lows,
-                close=closes,
-                name='가격',
-                increasing=dict(line=dict(color=colors['buy'])),
-                decreasing=dict(line=dict(color=colors['sell']))
-            )
-        )
-        
-        # 거래량 바 차트 추가
-        fig.add_trace(
-            go.Bar(
-                x=dates,
-                y=volumes,
-                name='거래량',
-                marker=dict(color=vol_color, opacity=0.5),
-                yaxis='y2'
-            )
-        )
+        vol_color = colors['buy'] if closes[-1] >= opens[-1] else colors['sell']
         
-        # 레이아웃 설정
-        fig.update_layout(
-            title=f'{selected_market} 실시간 차트',
-            xaxis_title='시간',
-            yaxis_title='가격 (KRW)',
-            yaxis2=dict(
-                title='거래량',
-                overlaying='y',
-                side='right',
-                showgrid=False
-            ),
-            height=500,
-            margin=dict(l=50, r=50, t=50, b=50, pad=4),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1),
-            hovermode='x unified',
-            template='plotly_dark' if is_dark_theme else 'plotly_white',
-            paper_bgcolor=colors['card_bg'],
-            plot_bgcolor=colors['card_bg'],
-            font=dict(color=colors['text'])
-        )
-        
-        # X축 레이아웃
-        fig.update_xaxes(
-            showgrid=True,
-            gridcolor=colors['grid'],
-            zeroline=False,
-            rangeslider=dict(visible=False)
-        )
-        
-        # Y축 레이아웃
-        fig.update_yaxes(
-            showgrid=True,
-            gridcolor=colors['grid'],
-            zeroline=False
-        )
+        # 날짜는 초 단위 ISO 문자열로 전송
+        dates = np.datetime_as_string(candles['date'], unit='s')
         
         # 현재 가격 표시
         current_price_text = f"{current_price:,.0f} KRW"
         
-        # 시장 통계 정보
+        # 시장 통계 정보 (색상은 CSS 변수로 지정해 테마 전환 시 다시 그리지 않음)
         market_stats = html.Div([
             html.Span([
                 html.Span("변동률: ", className="text-muted"),
                 html.Span(f"{price_change:+.2f}%", 
                          className="fw-bold",
-                         style={"color": colors['buy'] if price_change >= 0 else colors['sell']})
+                         style={"color": CSS_COLORS['buy'] if price_change >= 0 else CSS_COLORS['sell']})
             ], className="me-3"),
             html.Span([
                 html.Span("24시간 고가: ", className="text-muted"),
@@ -868,292 +1233,226 @@ def update_price_chart(n, selected_market, theme_href):
             ])
         ])
         
-        return fig, current_price_text, market_stats
+        # 같은 마켓의 차트가 이미 그려져 있으면 데이터 배열만 Patch 로 교체
+        # (레이아웃/템플릿은 다시 보내지 않음)
+        chart_state = {'market': selected_market}
+        if rendered == chart_state:
+            patch = Patch()
+            patch['data'][0]['x'] = dates
+            patch['data'][0]['open'] = opens
+            patch['data'][0]['high'] = highs
+            patch['data'][0]['low'] = lows
+            patch['data'][0]['close'] = closes
+            patch['data'][1]['x'] = dates
+            patch['data'][1]['y'] = candles['volume']
+            patch['data'][1]['line']['color'] = vol_color
+            return patch, current_price_text, market_stats, dash.no_update
+        
+        # 트레이스는 plotly.js 가 그대로 받는 dict 로 구성 (graph_objs 검증 생략)
+        # 캔들은 최대 200개(get_candles 조회 개수)라 SVG 캔들스틱으로 충분
+        price_trace = dict(
+            type='candlestick',
+            x=dates,
+            open=opens,
+            high=highs,
+            low=lows,
+            close=closes,
+            name='가격',
+            increasing=dict(line=dict(color=colors['buy'])),
+            decreasing=dict(line=dict(color=colors['sell']))
+        )
+        
+        # 거래량 영역 차트 (WebGL)
+        volume_trace = dict(
+            type='scattergl',
+            x=dates,
+            y=candles['volume'],
+            mode='lines',
+            fill='tozeroy',
+            name='거래량',
+            line=dict(width=1, color=vol_color),
+            opacity=0.5,
+            yaxis='y2'
+        )
+        
+        # 차트 생성 (템플릿은 이름 대신 미리 변환해 둔 팔레트의 템플릿 dict 사용)
+        fig = dict(
+            data=[price_trace, volume_trace],
+            layout=dict(
+                PRICE_CHART_LAYOUT,
+                title=f'{selected_market} 실시간 차트',
+                template=THEME_PALETTE['dark' if is_dark_theme else 'light']['template']
+            )
+        )
+        
+        return fig, current_price_text, market_stats, chart_state
         
     except Exception as e:
-        logger.error(f"가격 차트 업데이트 중 오류 발생: {str(e)}")
-        return create_empty_figure(f"오류: {str(e)[:100]}"), "", ""
+        logger.exception("가격 차트 업데이트 중 오류 발생: %s", e)
+        return create_empty_figure(f"오류: {str(e)[:100]}"), "", "", None
 
-# 트레이딩 신호 차트 업데이트
-@app.callback(
-    Output('signals-chart', 'figure'),
-    [Input('interval-component', 'n_intervals'),
-     Input('market-dropdown', 'value'),
-     Input('theme-stylesheet', 'href')]
-)
-def update_signals_chart(n, selected_market, theme_href):
+# 트레이딩 신호 데이터 생성 (update_signals_panel 에서 호출, 차트는 브라우저에서 조립)
+def update_signals_data(selected_market):
+    """
+    신호 차트용 시간/가격/신호 종류/전략 배열을 반환합니다.
+    """
     if not selected_market:
-        return create_empty_figure("마켓을 선택해주세요")
-    
-    # 테마에 따른 차트 색상 결정
-    is_dark_theme = 'DARKLY' in theme_href if theme_href else True
-    color_theme = 'dark' if is_dark_theme else 'light'
-    colors = COLORS[color_theme]
+        return {'error': "마켓을 선택해주세요"}
     
     try:
         # 샘플 신호 데이터 생성 (실제로는 트레이딩 엔진에서 가져와야 함)
         # TODO: 실제 트레이딩 엔진에서 신호 데이터 가져오도록 수정
-        now = datetime.now()
-        signal_times = [now - timedelta(hours=i) for i in range(10, 0, -1)]
-        
-        # 간단한 샘플 신호 생성 (실제로는 트레이딩 엔진의 신호 사용)
-        signals = []
-        for i, time in enumerate(signal_times):
-            signal_type = "BUY" if i % 3 == 0 else "SELL" if i % 3 == 1 else "HOLD"
-            signals.append({
-                'time': time,
-                'type': signal_type,
-                'strategy': 'SMA' if i % 2 == 0 else 'RSI',
-                'price': 80000000 + (i * 100000)
-            })
-        
-        fig = go.Figure()
-        
-        # 시간 축
-        times = [s['time'] for s in signals]
-        prices = [s['price'] for s in signals]
-        
-        # 신호 점 표시
-        buy_signals = [s for s in signals if s['type'] == 'BUY']
-        sell_signals = [s for s in signals if s['type'] == 'SELL']
-        
-        # 매수 신호
-        if buy_signals:
-            buy_times = [s['time'] for s in buy_signals]
-            buy_prices = [s['price'] for s in buy_signals]
-            buy_texts = [f"{s['strategy']} 매수 신호<br>{s['price']:,}원" for s in buy_signals]
-            
-            fig.add_trace(go.Scatter(
-                x=buy_times,
-                y=buy_prices,
-                mode='markers',
-                marker=dict(
-                    symbol='triangle-up',
-                    size=15,
-                    color=colors['buy'],
-                    line=dict(width=2, color=colors['card_bg'])
-                ),
-                name='매수 신호',
-                text=buy_texts,
-                hoverinfo='text'
-            ))
-        
-        # 매도 신호
-        if sell_signals:
-            sell_times = [s['time'] for s in sell_signals]
-            sell_prices = [s['price'] for s in sell_signals]
-            sell_texts = [f"{s['strategy']} 매도 신호<br>{s['price']:,}원" for s in sell_signals]
-            
-            fig.add_trace(go.Scatter(
-                x=sell_times,
-                y=sell_prices,
-                mode='markers',
-                marker=dict(
-                    symbol='triangle-down',
-                    size=15,
-                    color=colors['sell'],
-                    line=dict(width=2, color=colors['card_bg'])
-                ),
-                name='매도 신호',
-                text=sell_texts,
-                hoverinfo='text'
-            ))
-        
-        # 가격 라인
-        fig.add_trace(go.Scatter(
-            x=times,
-            y=prices,
-            mode='lines',
-            line=dict(width=2, color=colors['primary']),
-            name='가격'
-        ))
-        
-        # 레이아웃 설정
-        fig.update_layout(
-            title="최근 10개 트레이딩 신호",
-            xaxis_title="시간",
-            yaxis_title="가격 (KRW)",
-            height=300,
-            margin=dict(l=50, r=50, t=50, b=50, pad=4),
-            hovermode='closest',
-            # 테마별 스타일 설정
-            template='plotly_dark' if is_dark_theme else 'plotly_white',
-            paper_bgcolor=colors['card_bg'],
-            plot_bgcolor=colors['card_bg'],
-            font=dict(color=colors['text']),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
-        
-        # X축 레이아웃
-        fig.update_xaxes(
-            showgrid=True,
-            gridcolor=colors['grid'],
-            zeroline=False
-        )
-        
-        # Y축 레이아웃
-        fig.update_yaxes(
-            showgrid=True,
-            gridcolor=colors['grid'],
-            zeroline=False
-        )
-        
-        return fig
+        i = np.arange(10)
+        times = np.datetime64(datetime.now(), 's') - (10 - i).astype('timedelta64[h]')
+        
+        return {
+            'times': np.datetime_as_string(times, unit='s'),
+            'prices': 80000000 + i * 100000,
+            'types': np.where(i % 3 == 0, 'BUY', np.where(i % 3 == 1, 'SELL', 'HOLD')).tolist(),
+            'strategies': np.where(i % 2 == 0, 'SMA', 'RSI').tolist()
+        }
         
     except Exception as e:
-        logger.error(f"신호 차트 업데이트 중 오류 발생: {str(e)}")
-        return create_empty_figure(f"오류: {str(e)[:100]}")
+        logger.exception("신호 차트 업데이트 중 오류 발생: %s", e)
+        return {'error': f"오류: {str(e)[:100]}"}
 
-# 성능 차트 업데이트
-@app.callback(
-    Output('performance-chart', 'figure'),
-    [Input('interval-component', 'n_intervals'),
-     Input('theme-stylesheet', 'href')]
-)
-def update_performance_chart(n, theme_href):
-    # 테마에 따른 차트 색상 결정
-    is_dark_theme = 'DARKLY' in theme_href if theme_href else True
-    color_theme = 'dark' if is_dark_theme else 'light'
-    colors = COLORS[color_theme]
-    
+def sample_performance(days, seed=None):
+    """
+    최근 days 일간의 샘플 (날짜, 일간 손익) 배열을 생성합니다.
+    """
+    rng = np.random.default_rng(seed)
+    i = np.arange(days)
+    # 랜덤하면서도 추세가 있는 패턴 (60% 상승, 40% 하락 경향)
+    trend = np.where(i % 10 < 6, 0.6, -0.4)
+    daily_pnl = rng.normal(trend, 0.5) * 10000
+    daily_pnl[0] = 0
+    dates = pd.date_range(datetime.now() - timedelta(days=days), periods=days, freq='D').to_numpy()
+    return dates, daily_pnl
+
+# 성능 차트 데이터 생성 (update_performance_panel 에서 호출)
+def update_performance_data(rendered):
+    """
+    누적 손익 차트용 날짜/일간 손익/누적 손익 배열을 반환합니다. (차트는 브라우저에서 조립)
+    """
     try:
         # 샘플 데이터 생성 (필요한 경우)
-        if 'dates' not in data_cache['performance'] or not data_cache['performance'].get('dates'):
-            # 데이터 구조 초기화
-            data_cache['performance'] = {
-                'dates': [],
-                'pnl': [],
-                'cumulative_pnl': []
-            }
-            
+        performance = data_cache['performance']
+        if not len(performance):
             # 샘플 데이터 생성 (지난 30일)
-            start_date = datetime.now() - timedelta(days=30)
-            cumulative_pnl = 0
-            
-            for i in range(30):
-                date = start_date + timedelta(days=i)
-                
-                # 더 자연스러운 PnL 변동 패턴
-                if i == 0:
-                    daily_pnl = 0
-                else:
-                    # 랜덤하면서도 추세가 있는 패턴
-                    trend = 0.6 if i % 10 < 6 else -0.4  # 60% 상승, 40% 하락 경향
-                    volatility = np.random.normal(trend, 0.5) * 10000
-                    daily_pnl = volatility
-                
-                cumulative_pnl += daily_pnl
-                
-                data_cache['performance']['dates'].append(date)
-                data_cache['performance']['pnl'].append(daily_pnl)
-                data_cache['performance']['cumulative_pnl'].append(cumulative_pnl)
-        
-        # 성능 차트 생성
-        fig = go.Figure()
-        
-        # 누적 수익/손실 라인
-        cumulative_pnl = data_cache['performance']['cumulative_pnl']
-        dates = data_cache['performance']['dates']
-        is_profit = cumulative_pnl[-1] >= 0
-        line_color = colors['buy'] if is_profit else colors['sell']
-        
-        # 메인 라인 차트
-        fig.add_trace(
-            go.Scatter(
-                x=dates,
-                y=cumulative_pnl,
-                mode='lines',
-                name='누적 손익',
-                line=dict(width=3, color=line_color),
-                fill='tozeroy',
-                fillcolor=f'rgba({int(line_color[1:3], 16)}, {int(line_color[3:5], 16)}, {int(line_color[5:7], 16)}, 0.2)'  # 20% 투명도의 rgba 색상
-            )
-        )
-        
-        # 일간 수익/손실 바 차트
-        daily_pnl = data_cache['performance']['pnl']
-        bar_colors = [colors['buy'] if pnl >= 0 else colors['sell'] for pnl in daily_pnl]
-        
-        # 바 차트 추가 (yaxis2에 표시)
-        fig.add_trace(
-            go.Bar(
-                x=dates,
-                y=daily_pnl,
-                name='일간 손익',
-                marker_color=bar_colors,
-                opacity=0.7,
-                yaxis='y2'
-            )
-        )
-        
-        # 레이아웃 설정
-        fig.update_layout(
-            title='누적 손익 추이',
-            xaxis_title='날짜',
-            yaxis=dict(
-                title='누적 손익 (KRW)',
-                side='left',
-                showgrid=True,
-                gridcolor=colors['grid']
-            ),
-            yaxis2=dict(
-                title='일간 손익 (KRW)',
-                overlaying='y',
-                side='right',
-                showgrid=False
-            ),
-            height=350,
-            margin=dict(l=50, r=50, t=50, b=50, pad=4),
-            hovermode='x unified',
-            # 테마별 스타일 설정
-            template='plotly_dark' if is_dark_theme else 'plotly_white',
-            paper_bgcolor=colors['card_bg'],
-            plot_bgcolor=colors['card_bg'],
-            font=dict(color=colors['text']),
-            legend=dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
-        )
-        
-        # X축 레이아웃
-        fig.update_xaxes(
-            showgrid=True,
-            gridcolor=colors['grid'],
-            zeroline=False
-        )
-        
-        # 최종 수익/손실 주석 추가
-        final_pnl = cumulative_pnl[-1]
-        final_date = dates[-1]
-        
-        fig.add_annotation(
-            x=final_date,
-            y=final_pnl,
-            text=f"현재 누적 손익: {final_pnl:,.0f}원",
-            showarrow=True,
-            arrowhead=2,
-            arrowcolor=line_color,
-            arrowsize=1,
-            arrowwidth=2,
-            bgcolor=colors['card_bg'],
-            bordercolor=line_color,
-            borderwidth=2,
-            borderpad=4,
-            font=dict(size=12, color=colors['text'])
-        )
-        
-        return fig
+            performance.extend(*sample_performance(30))
+        
+        dates, daily_pnl, cumulative_pnl = performance.view()
+        
+        # 마지막으로 보낸 뒤 데이터가 그대로면 아무것도 보내지 않음
+        # (링 버퍼가 가득 차면 개수가 고정되므로 마지막 날짜/누적 손익까지 비교)
+        count = len(cumulative_pnl)
+        last = [count, str(dates[-1]), float(cumulative_pnl[-1])]
+        if rendered and rendered.get('last') == last:
+            return dash.no_update
+        
+        # 브라우저에 데이터가 있으면 새로 추가된 포인트만 Patch 로 전송
+        # (링 버퍼가 덮어쓰기 시작했으면 전체를 다시 보냄)
+        if rendered and not performance.full and rendered.get('count', count) < count:
+            new = slice(rendered['count'], count)
+            patch = Patch()
+            patch['dates'].extend(np.datetime_as_string(dates[new]).tolist())
+            patch['pnl'].extend(daily_pnl[new].tolist())
+            patch['cum'].extend(cumulative_pnl[new].tolist())
+            patch['count'] = count
+            patch['last'] = last
+            return patch
+        
+        # 차트 표시용으로는 float32 정밀도면 충분 (JSON 전송량 감소)
+        return {
+            'dates': np.datetime_as_string(dates),
+            'pnl': daily_pnl.astype(np.float32),
+            'cum': cumulative_pnl.astype(np.float32),
+            'count': count,
+            'last': last
+        }
         
     except Exception as e:
-        logger.error(f"성능 차트 업데이트 중 오류: {e}")
-        return create_empty_figure(f"성능 데이터를 불러올 수 없습니다: {str(e)[:100]}")
+        logger.exception("성능 차트 업데이트 중 오류: %s", e)
+        return {'error': f"성능 데이터를 불러올 수 없습니다: {str(e)[:100]}"}
+
+# 신호 데이터 갱신 (기본 폴링 주기, 화면 밖이면 건너뛰고 다음 틱에 갱신)
+@app.callback(
+    Output('signals-data', 'data'),
+    [Input('interval-component', 'n_intervals'),
+     Input('market-dropdown', 'value')],
+    [State('visible-cards', 'data')]
+)
+def update_signals_panel(n, selected_market, visible_cards):
+    if not card_visible(visible_cards, 'signals-chart'):
+        raise PreventUpdate
+    return update_signals_data(selected_market)
+
+# 성능 데이터 갱신 (느린 폴링 주기, 성능 차트가 다시 보이면 performance-visible 갱신으로 바로 그림)
+@app.callback(
+    Output('performance-data', 'data'),
+    [Input('interval-slow', 'n_intervals'),
+     Input('performance-visible', 'data')],
+    [State('performance-data', 'data')]
+)
+def update_performance_panel(n, performance_visible, performance_data):
+    if performance_visible is False:
+        raise PreventUpdate
+    return update_performance_data(performance_data)
 
-# 트레이딩 시작/중지 콜백
+# 전략 카드 거래 활성화 배지 갱신 (시작/중지 버튼은 control_trading 에서 바로 반영)
 @app.callback(
+    Output('trading-enabled', 'data'),
+    [Input('interval-static', 'n_intervals'),
+     Input('refresh-strategy-btn', 'n_clicks')]
+)
+def update_trading_enabled(n, strategy_clicks):
+    return is_trading_enabled()
+
+# 성능 차트는 performance-data 와 현재 테마로 브라우저에서 조립
+app.clientside_callback(
+    ClientsideFunction(namespace='performance', function_name='render'),
+    Output('performance-chart', 'figure'),
+    Input('performance-data', 'data'),
+    Input('theme-stylesheet', 'href'),
+    State('theme-palette', 'data'),
+    State('performance-style', 'data')
+)
+
+# 전략 카드의 거래 활성화 배지만 브라우저에서 갱신 (카드 자체는 레이아웃에 고정)
+app.clientside_callback(
+    ClientsideFunction(namespace='ui', function_name='trading_badge'),
+    Output('trading-enabled-badge', 'children'),
+    Output('trading-enabled-badge', 'style'),
+    Input('trading-enabled', 'data')
+)
+
+# 신호 차트도 signals-data 와 현재 테마로 브라우저에서 조립
+app.clientside_callback(
+    ClientsideFunction(namespace='signals', function_name='render'),
+    Output('signals-chart', 'figure'),
+    Input('signals-data', 'data'),
+    Input('theme-stylesheet', 'href'),
+    State('theme-palette', 'data'),
+    State('signals-style', 'data')
+)
+
+# 트레이딩 상태 주기적 갱신 (브라우저가 /trading_status 를 직접 조회)
+app.clientside_callback(
+    ClientsideFunction(namespace='poll', function_name='trading_status'),
     Output("trading-status", "children"),
+    Input("interval-component", "n_intervals"),
+    State("trading-status", "children")
+)
+
+# 트레이딩 시작/중지 콜백 (버튼 클릭 시에만 서버에서 처리)
+@app.callback(
+    [Output("trading-status", "children", allow_duplicate=True),
+     Output("trading-enabled", "data", allow_duplicate=True)],
     [Input("start-trading-btn", "n_clicks"),
-     Input("stop-trading-btn", "n_clicks"),
-     Input("interval-component", "n_intervals")]  # 주기적 업데이트 추가
+     Input("stop-trading-btn", "n_clicks")],
+    prevent_initial_call=True
 )
-def control_trading(start_clicks, stop_clicks, n_intervals):
+def control_trading(start_clicks, stop_clicks):
     # callback_context 관련 오류 방지를 위한 안전한 접근 방식
     triggered_by_start = False
     triggered_by_stop = False
@@ -1161,11 +1460,11 @@ def control_trading(start_clicks, stop_clicks, n_intervals):
     try:
         ctx = dash.callback_context
         if ctx.triggered:
-            button_id = ctx.triggered[0]['prop_id'].split('.')[0]
+            button_id = ctx.triggered_id
             triggered_by_start = button_id == "start-trading-btn" and start_clicks and start_clicks > 0
             triggered_by_stop = button_id == "stop-trading-btn" and stop_clicks and stop_clicks > 0
     except Exception as e:
-        logger.error(f"콜백 컨텍스트 확인 중 오류 발생: {str(e)}")
+        logger.error("콜백 컨텍스트 확인 중 오류 발생: %s", e)
         # 콜백 컨텍스트를 사용할 수 없는 경우 직접 n_clicks로 판단
         # 이전 상태를 저장하는 로직이 없으므로 완벽하지는 않음
         if start_clicks and start_clicks > 0:
@@ -1184,89 +1483,119 @@ def control_trading(start_clicks, stop_clicks, n_intervals):
                 TRADING_ENGINE.is_trading_enabled = True
                 logger.info("거래 기능이 강제로 활성화되었습니다.")
                 
-            logger.info(f"거래 엔진 시작 완료. 거래 활성화 상태: {TRADING_ENGINE.is_trading_enabled}")
-            return get_trading_status_text()  # 실제 상태 반영
+            logger.info("거래 엔진 시작 완료. 거래 활성화 상태: %s", TRADING_ENGINE.is_trading_enabled)
+            return get_trading_status_text(use_cache=False), is_trading_enabled()  # 시작/중지 직후 실제 상태 반영
         else:
             logger.warning("거래 엔진이 초기화되지 않았습니다.")
-            return "트레이딩 상태: 엔진 미초기화"
+            return STATUS_NO_ENGINE, False
     
     elif triggered_by_stop:
         if TRADING_ENGINE:
             logger.info("대시보드에서 거래 중지 버튼이 클릭되었습니다.")
             TRADING_ENGINE.stop()
             logger.info("거래 엔진 중지 완료")
-            return get_trading_status_text()  # 실제 상태 반영
+            return get_trading_status_text(use_cache=False), is_trading_enabled()  # 시작/중지 직후 실제 상태 반영
         else:
             logger.warning("거래 엔진이 초기화되지 않았습니다.")
-            return "트레이딩 상태: 엔진 미초기화"
+            return STATUS_NO_ENGINE, False
     
-    # 주기적 업데이트 또는 초기 로드인 경우 실제 상태 반영
-    return get_trading_status_text()
+    # 그 외의 경우 실제 상태 반영
+    return get_trading_status_text(), is_trading_enabled()
 
-# 테마 전환 콜백
+# 테마 전환 콜백 (스타일시트와 페이지 스타일을 한 번에 갱신)
 @app.callback(
-    Output("theme-stylesheet", "href"),
+    [Output("theme-stylesheet", "href"),
+     Output("main-content", "style")],
     [Input("light-mode-btn", "n_clicks"),
      Input("dark-mode-btn", "n_clicks")]
 )
 def toggle_theme(light_clicks, dark_clicks):
     global current_theme
     
-    ctx = dash.callback_context
-    if not ctx.triggered:
-        # 초기 로드 시 현재 설정된 테마 사용
-        return THEMES[current_theme]
-    
-    button_id = ctx.triggered[0]['prop_id'].split('.')[0]
+    # 초기 로드 시에는 현재 설정된 테마 사용
+    button_id = dash.callback_context.triggered_id
     
     if button_id == "light-mode-btn":
         current_theme = 'LIGHT'
     elif button_id == "dark-mode-btn":
         current_theme = 'DARK'
     
-    return THEMES[current_theme]
+    # 테마별 스타일은 모듈 로드 시 미리 만들어 둔 것을 그대로 사용
+    return THEMES[current_theme], get_styles(current_theme)['page']
 
-# 테마 변경에 따른 UI 스타일 업데이트
-@app.callback(
-    Output('main-content', 'style'),
-    [Input('theme-stylesheet', 'href')]
+# 테마 전환 시 가격 차트는 브라우저에서 색상만 교체 (데이터 재조회/재생성 없음)
+app.clientside_callback(
+    ClientsideFunction(namespace='theme', function_name='restyle_fig'),
+    Output('price-chart', 'figure', allow_duplicate=True),
+    Input('theme-stylesheet', 'href'),
+    State('price-chart', 'figure'),
+    State('theme-palette', 'data'),
+    prevent_initial_call=True
+)
+
+# 테마 색상 CSS 변수 설정 (CSS_COLORS 를 쓰는 컴포넌트는 서버 호출 없이 색상이 바뀜)
+app.clientside_callback(
+    ClientsideFunction(namespace='theme', function_name='set_vars'),
+    Output('theme-vars', 'data'),
+    Input('theme-stylesheet', 'href'),
+    State('theme-palette', 'data')
 )
-def update_styles_on_theme_change(theme_href):
-    global current_theme
-    # 테마 변경에 따른 스타일 업데이트
-    current_theme = 'LIGHT' if 'FLATLY' in theme_href else 'DARK'
-    STYLES = get_current_styles()
-    return STYLES['page']
 
 # 트레이딩 상태 정보를 가져오는 헬퍼 함수 추가
-def get_trading_status_text():
+# 트레이딩 상태 텍스트 캐시 (동시 요청이 몰려도 엔진 상태는 짧은 주기로 한 번만 확인)
+STATUS_CACHE_TTL = 0.5
+# (확인 시각, 상태 텍스트) 튜플을 한 번에 교체해 다른 스레드가 시각/텍스트 불일치를 보지 않도록 함
+_status_cache = (float('-inf'), '')
+
+def get_trading_status_text(use_cache=True):
     """현재 트레이딩 엔진의 실제 상태를 확인하여 UI에 표시할 텍스트를 반환합니다."""
-    if not TRADING_ENGINE:
-        return "트레이딩 상태: 엔진 미초기화"
+    global _status_cache
+    now = time.monotonic()
+    checked_at, cached_text = _status_cache
+    if use_cache and now - checked_at < STATUS_CACHE_TTL:
+        return cached_text
     
-    if TRADING_ENGINE.running and TRADING_ENGINE.is_trading_enabled:
-        return "트레이딩 상태: 실행 중"
-    elif TRADING_ENGINE.running and not TRADING_ENGINE.is_trading_enabled:
-        return "트레이딩 상태: 엔진 실행 중 (거래 비활성화)"
+    # 엔진 상태는 한 번만 읽어 일관된 스냅샷으로 판단 (엔진 스레드가 도중에 바꿀 수 있음)
+    engine = TRADING_ENGINE
+    if not engine:
+        status_text = STATUS_NO_ENGINE
     else:
-        return "트레이딩 상태: 중지됨"
+        running, enabled = engine.running, engine.is_trading_enabled
+        if running and enabled:
+            status_text = STATUS_RUNNING
+        elif running:
+            status_text = STATUS_RUNNING_DISABLED
+        else:
+            status_text = STATUS_STOPPED
+    
+    _status_cache = (now, status_text)
+    return status_text
+
+# Dash 콜백 엔드포인트(_dash-update-component)와 같은 경로 접두사 아래에 등록
+# (assets/poll.js 는 requests_pathname_prefix 기준으로 조회)
+@server.route(app.config.routes_pathname_prefix + 'trading_status')
+def trading_status():
+    """
+    트레이딩 상태 텍스트를 일반 텍스트로 반환합니다. (클라이언트 사이드 폴링용)
+    """
+    return flask.Response(get_trading_status_text(), mimetype='text/plain',
+                          headers={'Cache-Control': 'no-store'})
 
 # 비트코인 시장 지표 업데이트 콜백 추가
 @app.callback(
     Output('bitcoin-indicators', 'children'),
-    [Input('interval-component', 'n_intervals'),
-     Input('theme-stylesheet', 'href')]
+    [Input('upbit-snapshot', 'data')]
 )
-def update_bitcoin_indicators(n, theme_href):
+def update_bitcoin_indicators(snapshot):
     """비트코인 시장 지표를 업데이트합니다."""
-    # 테마에 따른 스타일 결정
-    is_dark_theme = 'DARKLY' in theme_href if theme_href else True
-    color_theme = 'dark' if is_dark_theme else 'light'
-    colors = COLORS[color_theme]
+    # 테마 색상은 CSS 변수로 지정 (테마 전환 시 다시 그리지 않음)
+    colors = CSS_COLORS
+    if snapshot_unchanged(snapshot, 'btc_ticker'):
+        raise PreventUpdate
     
     try:
-        # 비트코인 티커 정보 조회
-        ticker = api.get_ticker('KRW-BTC')
+        # 비트코인 티커 정보 (upbit-snapshot 콜백에서 조회)
+        ticker = data_cache['market_data'].get('KRW-BTC', {}).get('ticker')
         
         if not ticker or len(ticker) == 0:
             return dbc.Alert("비트코인 시장 지표를 불러올 수 없습니다.", color="warning", className="m-0")
@@ -1336,192 +1665,76 @@ def update_bitcoin_indicators(n, theme_href):
         
         return dbc.Card(dbc.CardBody(indicators), className="mt-3")
         
-    except requests.exceptions.Timeout:
-        logger.error("비트코인 시장 지표 조회 중 타임아웃 발생")
-        return dbc.Alert("서버 응답 시간이 초과되었습니다. 잠시 후 다시 시도해주세요.", color="warning", className="m-0")
-        
-    except requests.exceptions.ConnectionError:
-        logger.error("비트코인 시장 지표 조회 중 연결 오류 발생")
-        return dbc.Alert("서버 연결에 실패했습니다. 인터넷 연결을 확인해주세요.", color="warning", className="m-0")
-        
     except Exception as e:
-        logger.error(f"비트코인 시장 지표 업데이트 중 오류: {str(e)}")
-        traceback.print_exc()
+        logger.exception("비트코인 시장 지표 업데이트 중 오류: %s", e)
         return dbc.Alert(f"비트코인 시장 지표를 업데이트하는 중 오류 발생: {str(e)[:100]}", color="danger", className="m-0")
 
-# 전략 정보 업데이트 콜백 수정
-@app.callback(
-    Output('strategy-info', 'children'),
-    [Input('interval-component', 'n_intervals'),
-     Input('refresh-strategy-btn', 'n_clicks'),
-     Input('theme-stylesheet', 'href')]
-)
-def update_strategy_info(n_intervals, n_clicks, theme_href):
-    """거래 전략 정보를 업데이트합니다."""
-    # 테마에 따른 스타일 결정
-    is_dark_theme = 'DARKLY' in theme_href if theme_href else True
-    color_theme = 'dark' if is_dark_theme else 'light'
-    colors = COLORS[color_theme]
-    
-    try:
-        # 전략 정보 생성
-        strategies = []
-        
-        # SMA 전략 정보
-        strategies.append({
-            'name': 'SMA 교차 전략',
-            'description': '단기(3일선)가 장기(10일선)를 상향돌파하면 매수, 하향돌파하면 매도',
-            'params': {
-                '단기 이동평균': '3일',
-                '장기 이동평균': '10일',
-                '시그널 체크': '크로스오버 감지'
-            }
-        })
-        
-        # RSI 전략 정보
-        strategies.append({
-            'name': 'RSI 전략',
-            'description': 'RSI 지표가 과매도 영역에서 반등 시 매수, 과매수 영역에서 하락 시 매도',
-            'params': {
-                '기간': '8일', 
-                '과매수 기준': '80 이상',
-                '과매도 기준': '20 이하'
-            }
-        })
-        
-        # 볼린저 밴드 전략 정보
-        strategies.append({
-            'name': '볼린저 밴드 전략',
-            'description': '가격이 하단밴드 아래로 내려가면 매수, 상단밴드 위로 올라가면 매도',
-            'params': {
-                '이동평균 기간': '10일',
-                '표준편차 배수': '2.5',
-                '밴드 폭': '밴드폭 기준 거래 없음'
-            }
-        })
-        
-        # 리스크 관리 정보
-        risk_management = {
-            'profit_target': '5%',  # 익절 목표
-            'stop_loss': '3%',       # 손절 기준
-            'max_position': '계정 잔액의 100%',  # 최대 포지션 크기
-            'min_order': '5,000원',  # 최소 주문 금액
-            'trading_on': TRADING_ENGINE.is_trading_enabled if TRADING_ENGINE else False
-        }
-        
-        # 전략 카드 생성
-        strategy_cards = []
-        
-        # 리스크 관리 카드 생성
-        risk_card = dbc.Card([
-            dbc.CardHeader(html.H6("리스크 관리 설정", className="m-0 fw-bold text-primary")),
-            dbc.CardBody([
-                dbc.Row([
-                    dbc.Col([
-                        html.P([
-                            html.Span("익절 목표: ", className="text-muted"),
-                            html.Span(risk_management['profit_target'], className="fw-bold")
-                        ], className="mb-2"),
-                        html.P([
-                            html.Span("손절 기준: ", className="text-muted"),
-                            html.Span(risk_management['stop_loss'], className="fw-bold")
-                        ], className="mb-2"),
-                    ], width=6),
-                    dbc.Col([
-                        html.P([
-                            html.Span("최대 포지션: ", className="text-muted"),
-                            html.Span(risk_management['max_position'], className="fw-bold")
-                        ], className="mb-2"),
-                        html.P([
-                            html.Span("최소 주문액: ", className="text-muted"),
-                            html.Span(risk_management['min_order'], className="fw-bold")
-                        ], className="mb-2"),
-                        html.P([
-                            html.Span("거래 활성화: ", className="text-muted"),
-                            html.Span(
-                                "활성화" if risk_management['trading_on'] else "비활성화", 
-                                className="fw-bold",
-                                style={"color": colors['buy'] if risk_management['trading_on'] else colors['sell']}
-                            )
-                        ], className="mb-0"),
-                    ], width=6),
-                ]),
-            ])
-        ], className="mb-3 shadow-sm")
-        
-        strategy_cards.append(risk_card)
-        
-        # 개별 전략 카드 생성
-        for i, strategy in enumerate(strategies):
-            strategy_card = dbc.Card([
-                dbc.CardHeader(html.H6(strategy['name'], className="m-0 fw-bold text-primary")),
-                dbc.CardBody([
-                    html.P(strategy['description'], className="mb-3 small"),
-                    html.Div([
-                        dbc.Row([
-                            dbc.Col([
-                                html.Span(key + ": ", className="text-muted small"),
-                                html.Span(value, className="fw-bold small")
-                            ], width="auto", className="me-3 mb-2")
-                            for key, value in strategy['params'].items()
-                        ], className="g-0")
-                    ])
-                ])
-            ], className="mb-3 shadow-sm")
-            
-            strategy_cards.append(strategy_card)
-        
-        return html.Div(strategy_cards)
-        
-    except Exception as e:
-        logger.error(f"전략 정보 업데이트 중 오류 발생: {str(e)}")
-        return dbc.Alert(
-            f"전략 정보를 불러오는 중 오류가 발생했습니다: {str(e)[:100]}", 
-            color="danger",
-            className="m-0"
-        )
+# 거래 활성화 여부 (update_trading_enabled, control_trading 에서 호출)
+def is_trading_enabled():
+    """
+    트레이딩 엔진의 거래 활성화 여부를 반환합니다. (전략 카드의 배지는 assets/ui.js 에서 갱신)
+    """
+    return bool(TRADING_ENGINE and TRADING_ENGINE.is_trading_enabled)
 
-# 빈 차트 생성 함수
+# 빈 차트 생성 함수 (assets/performance.js 의 emptyFigure 와 같은 형태)
 def create_empty_figure(message="데이터가 없습니다"):
     # 현재 테마 확인
     is_dark_theme = current_theme == 'DARK'
     color_theme = 'dark' if is_dark_theme else 'light'
     colors = COLORS[color_theme]
+    hidden_axis = dict(showgrid=False, zeroline=False, showticklabels=False)
     
-    fig = go.Figure()
-    
-    # 메시지 추가
-    fig.add_annotation(
-        x=0.5, y=0.5,
-        xref="paper", yref="paper",
-        text=message,
-        showarrow=False,
-        font=dict(size=16, color=colors['text'])
-    )
-    
-    # 레이아웃 설정
-    fig.update_layout(
-        height=400,
-        paper_bgcolor=colors['card_bg'],
-        plot_bgcolor=colors['card_bg'],
-        font=dict(color=colors['text']),
-        xaxis=dict(showgrid=False, zeroline=False, showticklabels=False),
-        yaxis=dict(showgrid=False, zeroline=False, showticklabels=False)
+    # 메시지 주석만 있는 차트
+    return dict(
+        data=[],
+        layout=dict(
+            annotations=[dict(
+                x=0.5, y=0.5,
+                xref="paper", yref="paper",
+                text=message,
+                showarrow=False,
+                font=dict(size=16, color=colors['text'])
+            )],
+            height=400,
+            paper_bgcolor=colors['card_bg'],
+            plot_bgcolor=colors['card_bg'],
+            font=dict(color=colors['text']),
+            xaxis=hidden_axis,
+            yaxis=hidden_axis
+        )
     )
-    
-    return fig
 
 # 기존 레이아웃 대체
 app.layout = create_layout()
 
+# 운영 모드 WSGI 서버(waitress) 작업 스레드 수 - 동시 콜백 요청을 병렬로 처리
+WSGI_THREADS = 8
+
 def run_dashboard():
     """대시보드를 실행합니다"""
     initialize_data()  # 데이터 초기화 확실히 실행
     logger.info("Dashboard 데이터 초기화 완료")
+    debug = DASHBOARD_CONFIG.get('debug', False)
+    
+    # 디버그 모드가 아니면 Flask 개발 서버 대신 waitress 로 실행
+    if not debug:
+        try:
+            from waitress import serve
+        except ImportError:
+            logger.warning("waitress 가 설치되어 있지 않아 Flask 개발 서버로 실행합니다.")
+        else:
+            serve(
+                app.server,
+                host=DASHBOARD_CONFIG['host'],
+                port=DASHBOARD_CONFIG['port'],
+                threads=WSGI_THREADS
+            )
+            return
+    
     app.run(
         host=DASHBOARD_CONFIG['host'],
         port=DASHBOARD_CONFIG['port'],
-        debug=DASHBOARD_CONFIG.get('debug', False)
+        debug=debug
     )
 
 if __name__ == '__main__':
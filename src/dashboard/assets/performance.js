@@ -0,0 +1,156 @@
+// 서버가 내려준 성능/신호 데이터(performance-data, signals-data)로 차트를 브라우저에서 조립하는 클라이언트 사이드 콜백
+(function() {
+    function rgba(hex, alpha) {
+        const r = parseInt(hex.slice(1, 3), 16);
+        const g = parseInt(hex.slice(3, 5), 16);
+        const b = parseInt(hex.slice(5, 7), 16);
+        return 'rgba(' + r + ', ' + g + ', ' + b + ', ' + alpha + ')';
+    }
+
+    // 파이썬의 create_empty_figure 와 같은 메시지 전용 차트
+    function emptyFigure(message, colors) {
+        const hidden = {showgrid: false, zeroline: false, showticklabels: false};
+        return {
+            data: [],
+            layout: {
+                annotations: [{
+                    x: 0.5, y: 0.5, xref: 'paper', yref: 'paper',
+                    text: message, showarrow: false,
+                    font: {size: 16, color: colors.text}
+                }],
+                height: 400,
+                paper_bgcolor: colors.card_bg,
+                plot_bgcolor: colors.card_bg,
+                font: {color: colors.text},
+                xaxis: hidden,
+                yaxis: hidden
+            }
+        };
+    }
+
+    // 매수/매도 신호 마커 트레이스 (파이썬의 '{:,}원' 과 같은 가격 형식)
+    function signalTrace(data, type, name, symbol, color, style, colors) {
+        const x = [];
+        const y = [];
+        const text = [];
+        data.types.forEach(function(value, i) {
+            if (value === type) {
+                x.push(data.times[i]);
+                y.push(data.prices[i]);
+                text.push(data.strategies[i] + ' ' + name + '<br>' + data.prices[i].toLocaleString('en-US') + '원');
+            }
+        });
+        if (!x.length) {
+            return null;
+        }
+        return {
+            type: 'scatter',
+            x: x,
+            y: y,
+            mode: 'markers',
+            marker: {
+                symbol: symbol,
+                size: style.marker_size,
+                color: color,
+                line: {width: style.line_width, color: colors.card_bg}
+            },
+            name: name,
+            text: text,
+            hoverinfo: 'text'
+        };
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        signals: {
+            render: function(data, href, palette, style) {
+                if (!data || !palette || !style) {
+                    return window.dash_clientside.no_update;
+                }
+                const dark = !href || href.toLowerCase().includes('darkly');
+                const theme = palette[dark ? 'dark' : 'light'];
+                const colors = theme.colors;
+                if (data.error) {
+                    return emptyFigure(data.error, colors);
+                }
+
+                // 매수 신호, 매도 신호, 가격 라인 순서
+                const traces = [
+                    signalTrace(data, 'BUY', '매수 신호', 'triangle-up', colors.buy, style, colors),
+                    signalTrace(data, 'SELL', '매도 신호', 'triangle-down', colors.sell, style, colors),
+                    {
+                        type: 'scatter',
+                        x: data.times,
+                        y: data.prices,
+                        mode: 'lines',
+                        line: {width: style.line_width, color: colors.primary},
+                        name: '가격'
+                    }
+                ].filter(Boolean);
+
+                return {
+                    data: traces,
+                    layout: Object.assign({}, style.layout, {template: theme.template})
+                };
+            }
+        },
+
+        performance: {
+            render: function(data, href, palette, style) {
+                if (!data || !palette || !style) {
+                    return window.dash_clientside.no_update;
+                }
+                const dark = !href || href.toLowerCase().includes('darkly');
+                const theme = palette[dark ? 'dark' : 'light'];
+                const colors = theme.colors;
+                if (data.error) {
+                    return emptyFigure(data.error, colors);
+                }
+
+                const dates = data.dates;
+                const cum = data.cum;
+                const pnl = data.pnl;
+                const finalPnl = cum[cum.length - 1];
+                const lineColor = finalPnl >= 0 ? colors.buy : colors.sell;
+
+                // 누적 손익 라인 + 일간 손익 막대 (yaxis2)
+                const line = {
+                    type: 'scatter',
+                    x: dates,
+                    y: cum,
+                    mode: 'lines',
+                    name: '누적 손익',
+                    line: {width: 3, color: lineColor},
+                    fill: 'tozeroy',
+                    fillcolor: rgba(lineColor, style.fill_alpha)
+                };
+                const bar = Object.assign({
+                    type: 'bar',
+                    x: dates,
+                    y: pnl,
+                    marker: {color: pnl.map(function(value) {
+                        return value >= 0 ? colors.buy : colors.sell;
+                    })}
+                }, style.bar);
+
+                // 최종 수익/손실 주석
+                const annotation = Object.assign({
+                    x: dates[dates.length - 1],
+                    y: finalPnl,
+                    text: '현재 누적 손익: ' + (Math.round(finalPnl) || 0).toLocaleString('en-US') + '원',
+                    arrowcolor: lineColor,
+                    bgcolor: colors.card_bg,
+                    bordercolor: lineColor,
+                    font: {size: 12, color: colors.text}
+                }, style.annotation);
+
+                return {
+                    data: [line, bar],
+                    layout: Object.assign({}, style.layout, {
+                        template: theme.template,
+                        annotations: [annotation]
+                    })
+                };
+            }
+        }
+    });
+})();
@@ -0,0 +1,99 @@
+// 브라우저 탭이 보이지 않는 동안에는 서버 조회 주기를 전달하지 않는 클라이언트 사이드 콜백
+(function() {
+    // Dash 가 하위 경로로 서비스될 때도 같은 위치의 엔드포인트를 조회
+    function pathPrefix() {
+        const config = document.getElementById('_dash-config');
+        try {
+            return JSON.parse(config.textContent).requests_pathname_prefix || '/';
+        } catch (e) {
+            return '/';
+        }
+    }
+
+    // 화면 밖에 있으면 서버 갱신을 건너뛰는 무거운 카드 (app.py 의 card_visible 호출과 같은 id)
+    const LAZY_CARDS = ['price-chart', 'signals-chart', 'performance-chart', 'recent-trades'];
+    const visible = new Set();
+    let observer = null;
+
+    function observeCards() {
+        // 화면에 들어오기 조금 전부터 보이는 것으로 취급해 스크롤 시 빈 카드가 보이지 않게 함
+        observer = new IntersectionObserver(function(entries) {
+            entries.forEach(function(entry) {
+                if (entry.isIntersecting) {
+                    visible.add(entry.target.id);
+                } else {
+                    visible.delete(entry.target.id);
+                }
+            });
+        }, {rootMargin: '200px'});
+        LAZY_CARDS.forEach(function(id) {
+            const element = document.getElementById(id);
+            if (element) {
+                observer.observe(element);
+            }
+        });
+    }
+
+    // 카드 하나의 가시성 (바뀌지 않았으면 no_update 로 연결된 콜백을 트리거하지 않음)
+    function cardVisibility(id, visibleCards, current) {
+        if (!visibleCards) {
+            return window.dash_clientside.no_update;
+        }
+        const isVisible = visibleCards.indexOf(id) !== -1;
+        return isVisible === current ? window.dash_clientside.no_update : isVisible;
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        poll: {
+            visible_tick: function(n_intervals) {
+                if (document.hidden) {
+                    return window.dash_clientside.no_update;
+                }
+                return n_intervals;
+            },
+
+            // 관찰 결과가 나오기 전(또는 미지원 브라우저)에는 None 으로 두어 모든 카드를 갱신
+            visible_cards: function(n_intervals, current) {
+                const no_update = window.dash_clientside.no_update;
+                if (typeof IntersectionObserver === 'undefined') {
+                    return no_update;
+                }
+                if (!observer) {
+                    observeCards();
+                    return no_update;
+                }
+                const ids = LAZY_CARDS.filter(function(id) {
+                    return visible.has(id);
+                });
+                // 목록이 그대로면 카드 콜백을 다시 트리거하지 않음
+                if (current && current.join(',') === ids.join(',')) {
+                    return no_update;
+                }
+                return ids;
+            },
+
+            performance_visible: function(visibleCards, current) {
+                return cardVisibility('performance-chart', visibleCards, current);
+            },
+
+            // 트레이딩 상태 라벨은 Dash 콜백 대신 가벼운 텍스트 엔드포인트로 갱신
+            trading_status: function(n_intervals, current) {
+                const no_update = window.dash_clientside.no_update;
+                if (document.hidden && current) {
+                    return no_update;
+                }
+                return fetch(pathPrefix() + 'trading_status', {cache: 'no-store'})
+                    .then(function(response) {
+                        return response.ok ? response.text() : current;
+                    })
+                    .then(function(text) {
+                        // 상태가 그대로면 DOM 을 다시 그리지 않음
+                        return text === current ? no_update : text;
+                    })
+                    .catch(function() {
+                        return no_update;
+                    });
+            }
+        }
+    });
+})();
@@ -0,0 +1,81 @@
+// 테마 전환 시 서버 왕복 없이 차트 색상/템플릿만 교체하는 클라이언트 사이드 콜백
+window.dash_clientside = Object.assign({}, window.dash_clientside, {
+    theme: {
+        // 테마 색상을 CSS 변수(--buy-color 등)로 등록 (파이썬 CSS_COLORS 와 같은 이름)
+        set_vars: function(href, palette) {
+            if (!palette) {
+                return window.dash_clientside.no_update;
+            }
+            const dark = !href || href.toLowerCase().includes('darkly');
+            const colors = palette[dark ? 'dark' : 'light'].colors;
+            const style = document.documentElement.style;
+            Object.keys(colors).forEach(function(key) {
+                style.setProperty('--' + key.replace(/_/g, '-') + '-color', colors[key]);
+            });
+            return dark ? 'dark' : 'light';
+        },
+
+        restyle_fig: function(href, fig, palette) {
+            if (!fig || !palette) {
+                return window.dash_clientside.no_update;
+            }
+            const dark = !href || href.toLowerCase().includes('darkly');
+            const target = palette[dark ? 'dark' : 'light'];
+            const source = palette[dark ? 'light' : 'dark'];
+
+            // 이전 테마 색상 -> 새 테마 색상 매핑 (hex 및 rgba 접두사)
+            const mapping = {};
+            Object.keys(source.colors).forEach(function(key) {
+                const from = source.colors[key];
+                const to = target.colors[key];
+                if (!to || from === to) {
+                    return;
+                }
+                mapping[from.toUpperCase()] = to;
+                mapping[rgbaPrefix(from)] = rgbaPrefix(to);
+            });
+
+            function rgbaPrefix(hex) {
+                const r = parseInt(hex.slice(1, 3), 16);
+                const g = parseInt(hex.slice(3, 5), 16);
+                const b = parseInt(hex.slice(5, 7), 16);
+                return 'rgba(' + r + ', ' + g + ', ' + b + ',';
+            }
+
+            function recolor(value) {
+                if (typeof value === 'string') {
+                    if (mapping[value.toUpperCase()]) {
+                        return mapping[value.toUpperCase()];
+                    }
+                    if (value.startsWith('rgba(')) {
+                        const prefix = value.slice(0, value.lastIndexOf(',') + 1);
+                        if (mapping[prefix]) {
+                            return mapping[prefix] + value.slice(prefix.length);
+                        }
+                    }
+                    return value;
+                }
+                if (Array.isArray(value)) {
+                    return value.map(recolor);
+                }
+                if (value && typeof value === 'object') {
+                    const out = {};
+                    Object.keys(value).forEach(function(key) {
+                        // 데이터 배열은 색상이 아니므로 그대로 둔다
+                        out[key] = (key === 'x' || key === 'y' || key === 'template')
+                            ? value[key] : recolor(value[key]);
+                    });
+                    return out;
+                }
+                return value;
+            }
+
+            const layout = recolor(fig.layout || {});
+            layout.template = target.template;
+            return Object.assign({}, fig, {
+                data: (fig.data || []).map(recolor),
+                layout: layout
+            });
+        }
+    }
+});
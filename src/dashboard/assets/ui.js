@@ -0,0 +1,103 @@
+// 서버가 내려준 JSON 데이터로 UI 컴포넌트를 브라우저에서 조립하는 클라이언트 사이드 콜백
+(function() {
+    function component(namespace, type, props) {
+        return {namespace: namespace, type: type, props: props};
+    }
+
+    function html(type, props) {
+        return component('dash_html_components', type, props);
+    }
+
+    function dbc(type, props) {
+        return component('dash_bootstrap_components', type, props);
+    }
+
+    // 파이썬의 f"{value:,.0f}" / f"{value:.8f}" 와 같은 형식
+    function formatKrw(value) {
+        return Math.round(value).toLocaleString('en-US') + ' KRW';
+    }
+
+    function formatAmount(value) {
+        return Number(value).toFixed(8);
+    }
+
+    function field(label, value, valueProps, className) {
+        return html('P', {
+            children: [
+                html('Span', {children: label, className: 'text-muted'}),
+                html('Span', Object.assign({children: value}, valueProps))
+            ],
+            className: className || 'mb-2'
+        });
+    }
+
+    function accountCard(account) {
+        return dbc('Card', {
+            children: [
+                dbc('CardBody', {
+                    children: [
+                        html('Div', {
+                            children: [
+                                html('Span', {children: account.icon, className: 'me-2 fs-4'}),
+                                html('Span', {children: account.currency, className: 'fs-4 fw-bold'})
+                            ],
+                            className: 'd-flex align-items-center mb-3'
+                        }),
+                        html('Div', {
+                            children: [
+                                field('보유량: ', formatAmount(account.balance), {className: 'fw-bold'}),
+                                // 보유량+잠금 표시
+                                account.locked > 0
+                                    ? field('잠금: ', formatAmount(account.locked), {className: 'fw-bold'})
+                                    : null,
+                                field('평가금액: ', formatKrw(account.total), {className: 'fw-bold'}),
+                                field('평균단가: ', formatKrw(account.avg_buy_price),
+                                      {className: account.currency !== 'KRW' ? 'fw-bold' : ''}),
+                                field('평가손익: ', formatKrw(account.profit_loss), {
+                                    className: 'fw-bold fs-5',
+                                    style: {
+                                        'color': '#FFFFFF',  // 항상 흰색으로 강제 설정
+                                        'text-shadow': '0px 0px 2px rgba(0,0,0,0.9)'
+                                    }
+                                }, 'mb-0')
+                            ]
+                        })
+                    ],
+                    className: 'p-3'
+                })
+            ],
+            className: 'mb-3 h-100 shadow-sm'
+        });
+    }
+
+    window.dash_clientside = Object.assign({}, window.dash_clientside, {
+        ui: {
+            render_balances: function(data) {
+                if (!data) {
+                    return window.dash_clientside.no_update;
+                }
+                if (data.alert) {
+                    return dbc('Alert', {children: data.alert, color: data.color, className: 'm-0'});
+                }
+                // 계좌 정보 그리드 레이아웃
+                return dbc('Row', {
+                    children: data.accounts.map(function(account) {
+                        return dbc('Col', {children: accountCard(account), width: 12, md: 6});
+                    }),
+                    className: 'g-3'
+                });
+            },
+
+            // 전략 카드의 거래 활성화 배지 (색상은 CSS 변수, 파이썬 CSS_COLORS 와 같은 이름)
+            trading_badge: function(enabled) {
+                if (enabled === undefined || enabled === null) {
+                    return [window.dash_clientside.no_update, window.dash_clientside.no_update];
+                }
+                return [
+                    enabled ? '활성화' : '비활성화',
+                    {color: enabled ? 'var(--buy-color)' : 'var(--sell-color)'}
+                ];
+            }
+        }
+    });
+})();
@@ -11,7 +11,7 @@ from pathlib import Path
 # 현재 디렉토리를 Python 경로에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from config.config import TRADING_CONFIG, API_CONFIG, DASHBOARD_CONFIG
+from config.config import TRADING_CONFIG, DASHBOARD_CONFIG
 from src.api.upbit_api import UpbitAPI
 from src.risk_management.risk_manager import RiskManager
 from src.trading_engine import TradingEngine
@@ -29,31 +29,13 @@ class BaseStrategy(ABC):
         Fetch candle data from the API and convert to DataFrame
         """
         try:
-            candles = self.api.get_candles(self.market, interval, count, unit)
+            candles = self.api.get_candles_array(self.market, interval, count, unit)
             
-            # Convert to DataFrame
-            df = pd.DataFrame(candles)
-            
-            # Rename columns
-            df = df.rename(columns={
-                'opening_price': 'open',
-                'high_price': 'high',
-                'low_price': 'low',
-                'trade_price': 'close',
-                'candle_acc_trade_volume': 'volume',
-                'candle_date_time_kst': 'date'
-            })
-            
-            # Set date as index
-            df['date'] = pd.to_datetime(df['date'])
-            df = df.set_index('date')
-            
-            # Sort by date (ascending)
-            df = df.sort_index()
-            
-            # Convert to numeric
-            for col in ['open', 'high', 'low', 'close', 'volume']:
-                df[col] = pd.to_numeric(df[col])
+            # Convert to DataFrame (columns are already typed and sorted by date)
+            df = pd.DataFrame(
+                {col: candles[col] for col in ('open', 'high', 'low', 'close', 'volume')},
+                index=pd.DatetimeIndex(candles['date'], name='date')
+            )
                 
             self.df = df
             return df
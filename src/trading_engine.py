@@ -6,7 +6,7 @@ import numpy as np
 from datetime import datetime
 from collections import defaultdict
 
-from config.config import TRADING_CONFIG, API_CONFIG
+from config.config import TRADING_CONFIG
 from src.api.upbit_api import UpbitAPI
 from src.strategies.sma_strategy import SMAStrategy
 from src.strategies.rsi_strategy import RSIStrategy